@@ -23,13 +23,28 @@ Example with Claude Code:
 """
 
 import argparse
+from typing import TYPE_CHECKING, Any
 
-from .server import mcp
+if TYPE_CHECKING:
+    from .server import mcp
 
 __version__ = "0.5.0"
 __all__ = ["main", "mcp"]
 
 
+def __getattr__(name: str) -> Any:
+    """Import the FastMCP server on first access to `mcp`.
+
+    Importing FastMCP dominates startup time, so submodules such as
+    `tools` and `models`, and `--help`, do not pay for it.
+    """
+    if name == "mcp":
+        from .server import mcp
+
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main() -> None:
     """Main entry point for the MCP server."""
     parser = argparse.ArgumentParser(description="MCP server for Cloudflare")
@@ -52,6 +67,8 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    from .server import mcp
+
     if args.transport == "stdio":
         mcp.run()
     else:
@@ -4,18 +4,29 @@ This module provides a secure async HTTP client for the Cloudflare API.
 All requests go through this client to ensure consistent security practices.
 """
 
+import asyncio
 import logging
-from typing import Any
+import math
+import random
+import re
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from functools import cache
+from types import TracebackType
+from typing import Any, NamedTuple
 
 import httpx
+import orjson
 
-from .config import get_config
+from .config import API_BASE_URL, get_config
 from .errors import (
     CloudflareApiError,
     PermissionDeniedError,
     RateLimitError,
     ZoneNotFoundError,
 )
+from .ratelimit import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +36,93 @@ MAX_RESPONSE_SIZE = 10 * 1024 * 1024
 # Request timeout in seconds
 REQUEST_TIMEOUT = 30.0
 
+# Connection pool limits. Idle connections are kept for a minute so that
+# sequential tool calls reuse the same TLS session instead of re-handshaking.
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+
+# Cloudflare API limits: 1200 requests per 5 minutes, and 2000 purges by
+# cache tag, hostname, or prefix per day with a small burst allowance. URL
+# and purge-everything purges only count against the general limit.
+RATE_LIMIT_REQUESTS = 1200
+RATE_LIMIT_PERIOD = 300.0
+PURGE_LIMIT_REQUESTS = 2000
+PURGE_LIMIT_PERIOD = 86400.0
+PURGE_LIMIT_BURST = 30
+_LIMITED_PURGE_KEYS = frozenset({"tags", "hosts", "prefixes"})
+
+# Retries for rate-limited (429) and transient server (5xx) failures. Delays
+# grow exponentially with full jitter, so concurrent callers spread out.
+# Server errors are only retried for methods that are safe to repeat.
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 8.0
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Freshness windows for cached GET responses, in seconds. Single resources
+# (a zone, a record, a ruleset) change rarely; lists are kept short-lived.
+GET_CACHE_TTL_LIST = 5.0
+GET_CACHE_TTL_ITEM = 30.0
+
+# Limits on cached GET responses: entry count, total body bytes, and the
+# largest single body worth caching (bigger bodies are always re-fetched)
+GET_CACHE_MAX_ENTRIES = 256
+GET_CACHE_MAX_BYTES = 16 * 1024 * 1024
+GET_CACHE_MAX_ENTRY_BYTES = 1024 * 1024
+
+# Paths addressing a single resource: /zones/{id} or /zones/{id}/<kind>/{id}
+_SINGLE_RESOURCE_PATH = re.compile(r"/zones/[a-f0-9]{32}(?:/[a-z_]+/[a-f0-9]{32})?")
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+class _CachedResponse(NamedTuple):
+    """Raw body of a successful GET, kept so each hit parses fresh objects."""
+
+    expires_at: float
+    etag: str | None
+    content: bytes
+
+
+def _cache_ttl(path: str) -> float:
+    """Get the freshness window for a cached GET of the given path."""
+    if _SINGLE_RESOURCE_PATH.fullmatch(path):
+        return GET_CACHE_TTL_ITEM
+    return GET_CACHE_TTL_LIST
+
+
+def _cache_scope(path: str) -> str:
+    """Get the path prefix whose cached responses a write to path invalidates.
+
+    Writes under /zones/{id} evict everything cached for that zone.
+    """
+    return "/".join(path.split("/")[:3])
 
-class CloudflareClient:
+
+def _is_retryable(method: str, status_code: int) -> bool:
+    """Check whether a failed request may be sent again."""
+    if status_code == 429:
+        return True
+    return status_code >= 500 and method in IDEMPOTENT_METHODS
+
+
+def _retry_delay(attempt: int, response: httpx.Response) -> float:
+    """Compute how long to wait before the next attempt.
+
+    A numeric Retry-After on a 429 has already drained the rate limiter, which
+    holds the next request back for that long (or fails it with RateLimitError
+    if that exceeds REQUEST_TIMEOUT), so no extra delay is added.
+    """
+    if response.status_code == 429 and response.headers.get("retry-after", "").isdigit():
+        return 0.0
+    # Jitter only spreads retries out; it does not need a secure source
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt))  # noqa: S311
+
+
+class CloudflareClient(AbstractAsyncContextManager["CloudflareClient"]):
     """Async HTTP client for Cloudflare API.
 
     Security features:
@@ -35,23 +131,50 @@ class CloudflareClient:
     - TLS certificate validation (httpx default)
     - Request timeout enforcement
     - Response size limits
+
+    Performance features:
+    - HTTP/2 so concurrent requests multiplex over one connection
+    - Keep-alive connection pool shared by all tool calls
+    - Client-side token buckets matching Cloudflare's rate limits
+    - Short-lived GET response cache with ETag revalidation, invalidated
+      by any write to the same zone
+    - Concurrent identical GETs coalesced into a single API call
+
+    The client can be used as an async context manager; the connection pool
+    is opened on entry and closed on exit.
     """
 
     def __init__(self) -> None:
         """Initialize the Cloudflare client."""
         self._config = get_config()
         self._client: httpx.AsyncClient | None = None
+        self._cache: dict[CacheKey, _CachedResponse] = {}
+        self._cache_bytes = 0
+        # Invalidation count per cache scope, so a GET that was in flight
+        # during a write does not cache its (possibly stale) response
+        self._cache_generations: dict[str, int] = {}
+        self._in_flight: dict[
+            tuple[CacheKey, tuple[int, int]], asyncio.Future[bytes | None]
+        ] = {}
+        self._rate_limiter = AsyncTokenBucket(
+            RATE_LIMIT_REQUESTS / RATE_LIMIT_PERIOD, RATE_LIMIT_REQUESTS
+        )
+        self._purge_limiter = AsyncTokenBucket(
+            PURGE_LIMIT_REQUESTS / PURGE_LIMIT_PERIOD, PURGE_LIMIT_BURST
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
         if self._client is None:
             self._client = httpx.AsyncClient(
-                base_url=self._config.api_base_url,
+                base_url=API_BASE_URL,
                 headers={
                     "Authorization": f"Bearer {self._config.token}",
                     "Content-Type": "application/json",
                 },
                 timeout=httpx.Timeout(REQUEST_TIMEOUT),
+                limits=POOL_LIMITS,
+                http2=True,
                 # Enable TLS certificate verification (default, but explicit)
                 verify=True,
             )
@@ -63,12 +186,28 @@ class CloudflareClient:
             await self._client.aclose()
             self._client = None
 
+    async def __aenter__(self) -> "CloudflareClient":
+        """Open the connection pool."""
+        await self._get_client()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the connection pool."""
+        await self.close()
+
     async def _request(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        *,
+        cache: bool = True,
     ) -> dict[str, Any]:
         """Make an API request with error handling.
 
@@ -77,6 +216,7 @@ class CloudflareClient:
             path: API path (e.g., /zones)
             params: Query parameters
             json_data: JSON body data
+            cache: Whether a GET may use the response cache (read, fill, coalesce)
 
         Returns:
             API response data
@@ -86,41 +226,293 @@ class CloudflareClient:
             RateLimitError: On rate limiting
             PermissionDeniedError: On authorization failures
         """
+        # Writes, and reads that must not see or fill the cache, go straight out
+        if method != "GET" or not cache:
+            data, _ = await self._fetch(method, path, params, json_data)
+            return data
+
+        # Serve fresh GETs from cache
+        cache_key: CacheKey = (path, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached.expires_at > time.monotonic():
+            logger.debug("API cache hit: %s %s", method, path)
+            return orjson.loads(cached.content)  # type: ignore[no-any-return]
+
+        # Coalesce concurrent identical GETs into a single API call. Followers
+        # shield the shared future so their own cancellation cannot cancel it.
+        # A None result means the leader was cancelled, so followers retry the
+        # request themselves (the first to do so becomes the new leader). The
+        # key includes the scope generation, so a GET started after a write
+        # never joins one that was sent before it.
+        generation = self._cache_generation(path)
+        flight_key = (cache_key, generation)
+        in_flight = self._in_flight.get(flight_key)
+        if in_flight is not None:
+            logger.debug("API request coalesced: %s %s", method, path)
+            shared = await asyncio.shield(in_flight)
+            if shared is None:
+                return await self._request(method, path, params)
+            return orjson.loads(shared)  # type: ignore[no-any-return]
+
+        future: asyncio.Future[bytes | None] = asyncio.get_running_loop().create_future()
+        self._in_flight[flight_key] = future
+        try:
+            data, body = await self._fetch(
+                method,
+                path,
+                params,
+                None,
+                cache_key=cache_key,
+                cached=cached,
+                generation=generation,
+            )
+        except asyncio.CancelledError:
+            future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved so it is not logged when no one was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(body)
+        finally:
+            del self._in_flight[flight_key]
+        return data
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        *,
+        cache_key: CacheKey | None = None,
+        cached: _CachedResponse | None = None,
+        generation: tuple[int, int] = (0, 0),
+    ) -> tuple[dict[str, Any], bytes]:
+        """Perform a request, check it for errors, and update the GET cache.
+
+        A stale cache entry with an ETag is revalidated with If-None-Match.
+        Writes invalidate cached responses for the affected zone. A GET
+        response is only cached if no such write happened since generation
+        was taken, i.e. while the request was in flight.
+
+        Returns:
+            The parsed response data and the raw body it was parsed from
+        """
+        headers: dict[str, str] | None = None
+        if cached is not None and cached.etag:
+            headers = {"If-None-Match": cached.etag}
+
+        response, body = await self._send(method, path, params, json_data, headers)
+
+        if method != "GET":
+            self._invalidate_cache(path)
+        elif cache_key is not None and self._cache_generation(path) != generation:
+            # A write to the same scope raced this GET, so don't cache its response
+            cache_key = None
+
+        if cached is not None and response.status_code == 304:
+            if cache_key is not None:
+                self._store_cache(cache_key, path, cached.etag, cached.content)
+            return orjson.loads(cached.content), cached.content
+
+        # Parse response
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise CloudflareApiError(
+                response.status_code, f"Invalid JSON response: {e}"
+            ) from e
+
+        # Handle error responses
+        if not response.is_success:
+            self._handle_error_response(response.status_code, data)
+
+        if cache_key is not None:
+            self._store_cache(cache_key, path, response.headers.get("etag"), body)
+
+        return data, body
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> tuple[httpx.Response, bytes]:
+        """Send a request, retrying rate-limited and transient server failures.
+
+        A 429 is retried for any method, since the request was rejected
+        before it ran. A 5xx is retried only for idempotent methods. After
+        MAX_RETRIES the last response is returned for normal error handling.
+
+        A tag/host/prefix purge takes one token of the purge budget per
+        logical request, however many attempts it needs.
+
+        Returns:
+            The final response (already closed) and its decoded body
+
+        Raises:
+            RateLimitError: If a rate limit budget is exhausted
+        """
+        limited_purge = (
+            path.endswith("/purge_cache")
+            and json_data is not None
+            and not _LIMITED_PURGE_KEYS.isdisjoint(json_data)
+        )
+        if limited_purge:
+            await self._acquire(self._purge_limiter)
+
+        attempt = 0
+        while True:
+            response, body = await self._send_once(method, path, params, json_data, headers)
+            if attempt >= MAX_RETRIES or not _is_retryable(method, response.status_code):
+                return response, body
+
+            delay = _retry_delay(attempt, response)
+            logger.debug(
+                "Retrying %s %s after HTTP %d in %.2fs",
+                method, path, response.status_code, delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_once(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> tuple[httpx.Response, bytes]:
+        """Send a single request through the rate limiters and read its body.
+
+        Returns:
+            The response (already closed) and its decoded body
+
+        Raises:
+            CloudflareApiError: On timeouts, transport failures, or oversized bodies
+            RateLimitError: If a rate limit budget is exhausted
+        """
         client = await self._get_client()
 
+        # Shape traffic to stay under Cloudflare's limits
+        await self._acquire(self._rate_limiter)
+
         # Log request (without sensitive data)
         logger.debug("API request: %s %s", method, path)
 
+        # Serialize the body with orjson; the client already sends
+        # Content-Type: application/json
+        content = orjson.dumps(json_data) if json_data is not None else None
+        request = client.build_request(
+            method, path, params=params, content=content, headers=headers
+        )
+
         try:
-            response = await client.request(
-                method=method,
-                url=path,
-                params=params,
-                json=json_data,
-            )
+            response = await client.send(request, stream=True)
+            try:
+                body = await self._read_body(response)
+            finally:
+                await response.aclose()
         except httpx.TimeoutException as e:
             raise CloudflareApiError(0, f"Request timeout: {e}") from e
         except httpx.RequestError as e:
             raise CloudflareApiError(0, f"Request failed: {e}") from e
 
-        # Check response size before parsing
+        # Honor the server's backoff for every queued request
+        retry_after = response.headers.get("retry-after", "")
+        if response.status_code == 429 and retry_after.isdigit():
+            self._rate_limiter.drain(float(retry_after))
+
+        return response, body
+
+    @staticmethod
+    async def _acquire(limiter: AsyncTokenBucket) -> None:
+        """Take a token from a rate limiter.
+
+        Fails fast rather than block a tool call for longer than a request
+        may take, e.g. while a slow purge budget refills or after a 429 with
+        a long Retry-After drained the bucket.
+
+        Raises:
+            RateLimitError: If the token would not be available within
+                REQUEST_TIMEOUT
+        """
+        wait = limiter.wait_time()
+        if wait > REQUEST_TIMEOUT:
+            raise RateLimitError(math.ceil(wait))
+        await limiter.acquire()
+
+    @staticmethod
+    async def _read_body(response: httpx.Response) -> bytes:
+        """Read a streamed response body, enforcing MAX_RESPONSE_SIZE.
+
+        Content-Length is only an early-out: chunked and compressed responses
+        often omit it, so the decoded bytes are counted as they arrive and the
+        read is aborted as soon as the limit is exceeded.
+
+        Raises:
+            CloudflareApiError: If the body exceeds MAX_RESPONSE_SIZE
+        """
         content_length = response.headers.get("content-length")
         if content_length and int(content_length) > MAX_RESPONSE_SIZE:
             raise CloudflareApiError(0, "Response too large")
 
-        # Parse response
-        try:
-            data = response.json()
-        except ValueError as e:
-            raise CloudflareApiError(
-                response.status_code, f"Invalid JSON response: {e}"
-            ) from e
-
-        # Handle error responses
-        if not response.is_success:
-            self._handle_error_response(response.status_code, data)
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) > MAX_RESPONSE_SIZE:
+                raise CloudflareApiError(0, "Response too large")
+        return bytes(body)
 
-        return data  # type: ignore[no-any-return]
+    def _store_cache(
+        self, key: CacheKey, path: str, etag: str | None, content: bytes
+    ) -> None:
+        """Store a GET response body, evicting the oldest entries when full."""
+        self._evict_cache(key)
+        size = len(content)
+        if size > GET_CACHE_MAX_ENTRY_BYTES:
+            return
+        while self._cache and (
+            len(self._cache) >= GET_CACHE_MAX_ENTRIES
+            or self._cache_bytes + size > GET_CACHE_MAX_BYTES
+        ):
+            self._evict_cache(next(iter(self._cache)))
+        expires_at = time.monotonic() + _cache_ttl(path)
+        self._cache[key] = _CachedResponse(expires_at, etag, content)
+        self._cache_bytes += size
+
+    def _evict_cache(self, key: CacheKey) -> None:
+        """Drop a cached GET response, if present, and release its bytes."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._cache_bytes -= len(entry.content)
+
+    def _cache_generation(self, path: str) -> tuple[int, int]:
+        """Get the invalidation counts of the scopes a GET of path falls in.
+
+        Scopes are /{collection} and /{collection}/{id} (see _cache_scope).
+        """
+        parts = path.split("/")
+        return (
+            self._cache_generations.get("/".join(parts[:2]), 0),
+            self._cache_generations.get("/".join(parts[:3]), 0),
+        )
+
+    def _invalidate_cache(self, path: str) -> None:
+        """Drop cached GET responses that a write to path may have changed."""
+        scope = _cache_scope(path)
+        self._cache_generations[scope] = self._cache_generations.get(scope, 0) + 1
+        stale = [
+            key for key in self._cache
+            if key[0] == scope or key[0].startswith(scope + "/")
+        ]
+        for key in stale:
+            self._evict_cache(key)
 
     def _handle_error_response(
         self, status_code: int, data: dict[str, Any]
@@ -135,30 +527,31 @@ class CloudflareClient:
             Various UserError subclasses based on error type
         """
         # Extract error details
-        errors = data.get("errors", [])
-        error_msg = errors[0].get("message", "Unknown error") if errors else "Unknown error"
-        error_code = errors[0].get("code", 0) if errors else 0
+        errors = data.get("errors")
+        error = errors[0] if errors else {}
+        error_msg = error.get("message", "Unknown error")
+        error_code = error.get("code", 0)
 
         # Handle specific status codes
-        if status_code == 401:
-            raise PermissionDeniedError("Valid API token")
-        if status_code == 403:
-            raise PermissionDeniedError("Required permission scope")
-        if status_code == 404:
-            raise ZoneNotFoundError(error_msg)
-        if status_code == 429:
-            retry_after = data.get("retry_after")
-            raise RateLimitError(retry_after)
-
-        raise CloudflareApiError(error_code, error_msg)
+        match status_code:
+            case 401:
+                raise PermissionDeniedError("Valid API token")
+            case 403:
+                raise PermissionDeniedError("Required permission scope")
+            case 404:
+                raise ZoneNotFoundError(error_msg, error_code)
+            case 429:
+                raise RateLimitError(data.get("retry_after"))
+            case _:
+                raise CloudflareApiError(error_code, error_msg)
 
     # Convenience methods for HTTP verbs
 
     async def get(
-        self, path: str, params: dict[str, Any] | None = None
+        self, path: str, params: dict[str, Any] | None = None, *, cache: bool = True
     ) -> dict[str, Any]:
-        """Make a GET request."""
-        return await self._request("GET", path, params=params)
+        """Make a GET request, bypassing the response cache if cache is False."""
+        return await self._request("GET", path, params=params, cache=cache)
 
     async def post(
         self,
@@ -189,6 +582,82 @@ class CloudflareClient:
         """Make a DELETE request."""
         return await self._request("DELETE", path)
 
+    async def list_all(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        per_page: int = 100,
+        concurrency: int = 8,
+    ) -> list[Any]:
+        """Fetch every page of a paginated list endpoint.
+
+        The first page reports total_pages in result_info; the remaining pages
+        are then fetched concurrently, bounded by `concurrency` and the
+        client's rate limiter.
+
+        Args:
+            path: API path of a paginated list endpoint
+            params: Query parameters (filters) applied to every page
+            per_page: Number of results per page
+            concurrency: Maximum number of pages in flight at once
+
+        Returns:
+            The concatenated 'result' arrays of all pages, in page order
+        """
+        base_params = {**(params or {}), "per_page": per_page}
+
+        first = await self.get(path, params={**base_params, "page": 1})
+        results: list[Any] = list(first.get("result", []))
+        total_pages: int = first.get("result_info", {}).get("total_pages", 1)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page: int) -> list[Any]:
+            async with semaphore:
+                response = await self.get(path, params={**base_params, "page": page})
+            page_results: list[Any] = response.get("result", [])
+            return page_results
+
+        pages = await asyncio.gather(*(fetch_page(p) for p in range(2, total_pages + 1)))
+        for page_results in pages:
+            results.extend(page_results)
+        return results
+
+    async def iter_all(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        per_page: int = 100,
+    ) -> AsyncIterator[Any]:
+        """Yield the results of a paginated list endpoint, one page at a time.
+
+        Unlike list_all, pages are fetched sequentially and bypass the GET
+        cache, so only the current page is held in memory and callers can
+        stop early or process very large lists incrementally.
+
+        Args:
+            path: API path of a paginated list endpoint
+            params: Query parameters (filters) applied to every page
+            per_page: Number of results per page
+
+        Yields:
+            Items from the 'result' array of each page, in order
+        """
+        base_params = {**(params or {}), "per_page": per_page}
+        page = 1
+
+        while True:
+            response = await self.get(
+                path, params={**base_params, "page": page}, cache=False
+            )
+            for item in response.get("result", []):
+                yield item
+
+            total_pages: int = response.get("result_info", {}).get("total_pages", 1)
+            if page >= total_pages:
+                return
+            page += 1
+
     async def graphql(
         self,
         query: str,
@@ -221,13 +690,13 @@ class CloudflareClient:
         return result
 
 
-# Global client instance
-_client: CloudflareClient | None = None
-
-
+@cache
 def get_client() -> CloudflareClient:
     """Get the global Cloudflare client instance."""
-    global _client
-    if _client is None:
-        _client = CloudflareClient()
-    return _client
+    return CloudflareClient()
+
+
+async def close_client() -> None:
+    """Close the global client's connection pool, if one was created."""
+    if get_client.cache_info().currsize:
+        await get_client().close()
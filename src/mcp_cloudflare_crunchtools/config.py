@@ -6,6 +6,7 @@ The token is stored as a SecretStr to prevent accidental logging.
 
 import logging
 import os
+from functools import cache
 
 from pydantic import SecretStr
 
@@ -13,6 +14,10 @@ from .errors import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Hardcoded Cloudflare API base URL.
+# This is intentionally not configurable to prevent SSRF attacks.
+API_BASE_URL = "https://api.cloudflare.com/client/v4"
+
 
 class Config:
     """Secure configuration handling.
@@ -21,6 +26,8 @@ class Config:
     via the token property when actually needed for API calls.
     """
 
+    __slots__ = ("_token",)
+
     def __init__(self) -> None:
         """Initialize configuration from environment variables.
 
@@ -48,11 +55,8 @@ class Config:
 
     @property
     def api_base_url(self) -> str:
-        """Hardcoded Cloudflare API base URL.
-
-        This is intentionally not configurable to prevent SSRF attacks.
-        """
-        return "https://api.cloudflare.com/client/v4"
+        """Hardcoded Cloudflare API base URL (see API_BASE_URL)."""
+        return API_BASE_URL
 
     def __repr__(self) -> str:
         """Safe repr that never exposes the token."""
@@ -63,10 +67,7 @@ class Config:
         return "Config(token=***)"
 
 
-# Global configuration instance - initialized on first import
-_config: Config | None = None
-
-
+@cache
 def get_config() -> Config:
     """Get the global configuration instance.
 
@@ -79,7 +80,4 @@ def get_config() -> Config:
     Raises:
         ConfigurationError: If configuration is invalid.
     """
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config()
@@ -47,10 +47,12 @@ class InvalidRuleIdError(UserError):
 class ZoneNotFoundError(UserError):
     """Zone not found or not accessible."""
 
-    def __init__(self, identifier: str) -> None:
+    def __init__(self, identifier: str, code: int = 0) -> None:
         # Don't include the full identifier in case it contains sensitive data
         safe_id = identifier[:20] + "..." if len(identifier) > 20 else identifier
         super().__init__(f"Zone not found or not accessible: {safe_id}")
+        # Cloudflare error code, to tell missing zones from other missing objects
+        self.code = code
 
 
 class PermissionDeniedError(UserError):
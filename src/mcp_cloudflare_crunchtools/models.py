@@ -5,38 +5,75 @@ and ensure data integrity before making API calls.
 """
 
 import re
-from typing import Any, Literal
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 # Valid DNS record types - intentionally restrictive
 DNS_RECORD_TYPES = frozenset({"A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV", "CAA", "PTR"})
+_ALLOWED_TYPES_STR = ", ".join(sorted(DNS_RECORD_TYPES))
 
-# Regex patterns for validation
-ZONE_ID_PATTERN = re.compile(r"^[a-f0-9]{32}$")
-RECORD_ID_PATTERN = re.compile(r"^[a-f0-9]{32}$")
-RULE_ID_PATTERN = re.compile(r"^[a-f0-9]{32}$")
+# Zone, record, and rule IDs share the same format: 32 lowercase hex characters
+HEX_ID_PATTERN = re.compile(r"[a-f0-9]{32}")
+_fullmatch_hex32 = HEX_ID_PATTERN.fullmatch
+
+
+@lru_cache(maxsize=2048)
+def _is_hex32(value: str) -> bool:
+    """Check whether a value is a 32-character lowercase hex string.
+
+    The same IDs are validated on nearly every tool call, so results are cached.
+    """
+    return _fullmatch_hex32(value) is not None
+
+
+def _validate_hex32(value: str, field: str) -> str:
+    """Validate a value is a 32-character hex string, naming the field on failure.
+
+    Wrong-length values are rejected before the cached check, so they never
+    reach (or fill) the cache.
+    """
+    if len(value) != 32 or not _is_hex32(value):
+        raise ValueError(f"{field} must be 32-character hex string")
+    return value
 
 
 def validate_zone_id(zone_id: str) -> str:
     """Validate a zone ID is a 32-character hex string."""
-    if not ZONE_ID_PATTERN.match(zone_id):
-        raise ValueError("zone_id must be 32-character hex string")
-    return zone_id
+    return _validate_hex32(zone_id, "zone_id")
 
 
 def validate_record_id(record_id: str) -> str:
     """Validate a record ID is a 32-character hex string."""
-    if not RECORD_ID_PATTERN.match(record_id):
-        raise ValueError("record_id must be 32-character hex string")
-    return record_id
+    return _validate_hex32(record_id, "record_id")
 
 
 def validate_rule_id(rule_id: str) -> str:
     """Validate a rule ID is a 32-character hex string."""
-    if not RULE_ID_PATTERN.match(rule_id):
-        raise ValueError("rule_id must be 32-character hex string")
-    return rule_id
+    return _validate_hex32(rule_id, "rule_id")
+
+
+def _normalize_record_type(value: str) -> str:
+    """Validate a DNS record type, normalizing it to uppercase."""
+    if value in DNS_RECORD_TYPES:
+        return value
+    value_upper = value.upper()
+    if value_upper not in DNS_RECORD_TYPES:
+        raise ValueError(f"Invalid record type. Allowed: {_ALLOWED_TYPES_STR}")
+    return value_upper
+
+
+# Field types sharing the standalone validators, so model fields and direct
+# calls accept the same values and report the same errors
+ZoneId = Annotated[str, AfterValidator(validate_zone_id)]
+RecordType = Annotated[str, AfterValidator(_normalize_record_type)]
+
+# DNS record field constraints, shared by the create and update models
+_DnsName = Annotated[str, Field(min_length=1, max_length=255)]
+_DnsContent = Annotated[str, Field(min_length=1, max_length=2048)]
+_Ttl = Annotated[int, Field(ge=1, le=86400)]
+_Priority = Annotated[int, Field(ge=0, le=65535)]
 
 
 class ZoneInput(BaseModel):
@@ -45,96 +82,57 @@ class ZoneInput(BaseModel):
     Either zone_id or zone_name should be provided, but not both required.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-    zone_id: str | None = Field(
+    zone_id: ZoneId | None = Field(
         default=None, description="Zone ID (32-character hex string)"
     )
     zone_name: str | None = Field(
         default=None, description="Zone name (domain like example.com)"
     )
 
-    @field_validator("zone_id")
-    @classmethod
-    def validate_zone_id_format(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        return validate_zone_id(v)
-
 
 class DnsRecordInput(BaseModel):
     """Validated DNS record input for creation."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-    type: str = Field(..., description="DNS record type (A, AAAA, CNAME, MX, TXT, NS, SRV, CAA)")
-    name: str = Field(
-        ..., min_length=1, max_length=255, description="DNS record name (e.g., www or @ for root)"
-    )
-    content: str = Field(
-        ..., min_length=1, max_length=2048, description="DNS record content (e.g., IP address)"
-    )
-    ttl: int = Field(
-        default=1, ge=1, le=86400, description="TTL in seconds (1 = auto)"
+    type: RecordType = Field(
+        ..., description="DNS record type (A, AAAA, CNAME, MX, TXT, NS, SRV, CAA)"
     )
+    name: _DnsName = Field(..., description="DNS record name (e.g., www or @ for root)")
+    content: _DnsContent = Field(..., description="DNS record content (e.g., IP address)")
+    ttl: _Ttl = Field(default=1, description="TTL in seconds (1 = auto)")
     proxied: bool = Field(
         default=False, description="Whether to proxy through Cloudflare"
     )
-    priority: int | None = Field(
-        default=None, ge=0, le=65535, description="Priority (required for MX and SRV)"
+    priority: _Priority | None = Field(
+        default=None, description="Priority (required for MX and SRV)"
     )
     comment: str | None = Field(
         default=None, max_length=500, description="Optional comment for the record"
     )
 
-    @field_validator("type")
-    @classmethod
-    def validate_record_type(cls, v: str) -> str:
-        v_upper = v.upper()
-        if v_upper not in DNS_RECORD_TYPES:
-            allowed = ", ".join(sorted(DNS_RECORD_TYPES))
-            raise ValueError(f"Invalid record type. Allowed: {allowed}")
-        return v_upper
-
 
 class DnsRecordUpdateInput(BaseModel):
     """Validated DNS record input for updates."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-    type: str | None = Field(
+    type: RecordType | None = Field(
         default=None, description="DNS record type"
     )
-    name: str | None = Field(
-        default=None, min_length=1, max_length=255, description="DNS record name"
-    )
-    content: str | None = Field(
-        default=None, min_length=1, max_length=2048, description="DNS record content"
-    )
-    ttl: int | None = Field(
-        default=None, ge=1, le=86400, description="TTL in seconds"
-    )
+    name: _DnsName | None = Field(default=None, description="DNS record name")
+    content: _DnsContent | None = Field(default=None, description="DNS record content")
+    ttl: _Ttl | None = Field(default=None, description="TTL in seconds")
     proxied: bool | None = Field(
         default=None, description="Whether to proxy through Cloudflare"
     )
-    priority: int | None = Field(
-        default=None, ge=0, le=65535, description="Priority"
-    )
+    priority: _Priority | None = Field(default=None, description="Priority")
     comment: str | None = Field(
         default=None, max_length=500, description="Optional comment"
     )
 
-    @field_validator("type")
-    @classmethod
-    def validate_record_type(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        v_upper = v.upper()
-        if v_upper not in DNS_RECORD_TYPES:
-            allowed = ", ".join(sorted(DNS_RECORD_TYPES))
-            raise ValueError(f"Invalid record type. Allowed: {allowed}")
-        return v_upper
-
 
 class TransformRuleAction(BaseModel):
     """Transform rule action for header modifications."""
@@ -234,7 +232,7 @@ class CachePurgeInput(BaseModel):
         default=False, description="Purge all cached content"
     )
     files: list[str] | None = Field(
-        default=None, max_length=30, description="URLs to purge (max 30)"
+        default=None, max_length=900, description="URLs to purge (sent in batches of 30)"
     )
     tags: list[str] | None = Field(
         default=None, max_length=30, description="Cache tags to purge"
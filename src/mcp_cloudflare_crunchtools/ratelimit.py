@@ -0,0 +1,68 @@
+"""Client-side rate limiting.
+
+Cloudflare rejects requests over its API limits with HTTP 429. Shaping
+traffic before it leaves the client keeps bulk operations (enumerating many
+zones, batched purges) at a steady rate instead of failing mid-way.
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket shared by concurrent coroutines.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """Seconds until the requested number of tokens would be granted."""
+        self._refill()
+        return max(0.0, (tokens - self._tokens) / self._rate)
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Take the requested number of tokens, waiting until they are available.
+
+        Tokens are reserved immediately (the balance may go negative), so each
+        caller's wait accounts for everyone queued before it and wait_time()
+        stays exact under concurrency.
+        """
+        wait = self.wait_time(tokens)
+        self._tokens -= tokens
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Release the reservation so later callers can use the slot
+            self._tokens += tokens
+            raise
+
+    def drain(self, seconds: float) -> None:
+        """Empty the bucket so no token is available for the given number of seconds.
+
+        Used when the server reports a rate limit with Retry-After. Callers
+        already waiting keep their reservations.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self._rate)
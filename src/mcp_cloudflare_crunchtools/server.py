@@ -4,15 +4,20 @@ This module creates and configures the MCP server with all tools.
 """
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from fastmcp import FastMCP
 
+from .client import close_client
 from .tools import (
     create_dns_record,
+    create_dns_records,
     create_page_rule,
     create_waf_rule,
     delete_dns_record,
+    delete_dns_records,
     delete_page_rule,
     delete_waf_rule,
     get_dns_record,
@@ -21,6 +26,7 @@ from .tools import (
     get_traffic_by_country,
     get_zone,
     get_zone_analytics,
+    list_all_dns_records,
     list_dns_records,
     list_page_rules,
     list_request_header_rules,
@@ -39,6 +45,20 @@ from .tools import (
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_server: FastMCP[None]) -> AsyncIterator[None]:
+    """Release the shared Cloudflare connection pool when the server stops.
+
+    The client itself is still created lazily on the first tool call, so a
+    missing API token is reported as a tool error rather than a startup crash.
+    """
+    try:
+        yield
+    finally:
+        await close_client()
+
+
 # Create the FastMCP server
 mcp = FastMCP(
     name="mcp-cloudflare-crunchtools",
@@ -47,6 +67,7 @@ mcp = FastMCP(
         "Secure MCP server for Cloudflare DNS, Transform Rules,"
         " Page Rules, Cache, Analytics, and WAF"
     ),
+    lifespan=lifespan,
 )
 
 
@@ -123,6 +144,30 @@ async def list_dns_records_tool(
     )
 
 
+@mcp.tool()
+async def list_all_dns_records_tool(
+    zone_id: str,
+    type: str | None = None,
+    name: str | None = None,
+    content: str | None = None,
+) -> dict[str, Any]:
+    """List every DNS record for a Cloudflare zone in one call.
+
+    Fetches all pages concurrently, so large zones do not need repeated
+    paginated calls.
+
+    Args:
+        zone_id: Zone ID (32-character hex string)
+        type: Filter by record type (A, AAAA, CNAME, MX, TXT, etc.)
+        name: Filter by record name
+        content: Filter by record content
+
+    Returns:
+        All matching DNS records and their count
+    """
+    return await list_all_dns_records(zone_id=zone_id, type=type, name=name, content=content)
+
+
 @mcp.tool()
 async def get_dns_record_tool(
     zone_id: str,
@@ -236,6 +281,44 @@ async def delete_dns_record_tool(
     return await delete_dns_record(zone_id=zone_id, record_id=record_id)
 
 
+@mcp.tool()
+async def create_dns_records_tool(
+    zone_id: str,
+    records: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Create several DNS records in one call.
+
+    Records are validated up front and created concurrently. Records the API
+    rejects are listed in errors (by index) without failing the rest.
+
+    Args:
+        zone_id: Zone ID (32-character hex string)
+        records: Up to 100 records, each with type, name, content, and
+            optionally ttl, proxied, priority, comment
+
+    Returns:
+        Created records and per-record errors
+    """
+    return await create_dns_records(zone_id=zone_id, records=records)
+
+
+@mcp.tool()
+async def delete_dns_records_tool(
+    zone_id: str,
+    record_ids: list[str],
+) -> dict[str, Any]:
+    """Delete several DNS records in one call.
+
+    Args:
+        zone_id: Zone ID (32-character hex string)
+        record_ids: Up to 100 DNS record IDs (32-character hex strings)
+
+    Returns:
+        Deleted record IDs and per-record errors
+    """
+    return await delete_dns_records(zone_id=zone_id, record_ids=record_ids)
+
+
 # Register Transform Rules tools
 
 
@@ -457,13 +540,13 @@ async def purge_cache_tool(
 ) -> dict[str, Any]:
     """Purge cached content from Cloudflare's edge.
 
-    Use one of: purge_everything, files, tags, hosts, or prefixes.
+    Use exactly one of: purge_everything, files, tags, hosts, or prefixes.
     tags, hosts, and prefixes require Enterprise plan.
 
     Args:
         zone_id: Zone ID (32-character hex string)
         purge_everything: Purge all cached content
-        files: URLs to purge (max 30)
+        files: URLs to purge, at most 900 (sent in batches of 30)
         tags: Cache tags to purge (Enterprise)
         hosts: Hostnames to purge (Enterprise)
         prefixes: URL prefixes to purge (Enterprise)
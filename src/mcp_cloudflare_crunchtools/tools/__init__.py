@@ -12,8 +12,11 @@ from .analytics import (
 from .cache import purge_cache
 from .dns import (
     create_dns_record,
+    create_dns_records,
     delete_dns_record,
+    delete_dns_records,
     get_dns_record,
+    list_all_dns_records,
     list_dns_records,
     update_dns_record,
 )
@@ -45,10 +48,13 @@ __all__ = [
     "get_zone",
     # DNS
     "list_dns_records",
+    "list_all_dns_records",
     "get_dns_record",
     "create_dns_record",
     "update_dns_record",
     "delete_dns_record",
+    "create_dns_records",
+    "delete_dns_records",
     # Transform Rules
     "list_request_header_rules",
     "set_request_header_rules",
@@ -0,0 +1,56 @@
+"""Helpers shared by the tool modules."""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any
+
+from ..errors import UserError
+
+
+def result_object(response: dict[str, Any]) -> dict[str, Any]:
+    """Get the 'result' object of an API response.
+
+    Returns {} when the result is missing or null (some endpoints, e.g.
+    deletes, may return "result": null).
+    """
+    result: dict[str, Any] = response.get("result") or {}
+    return result
+
+
+def result_list(response: dict[str, Any]) -> list[Any]:
+    """Get the 'result' array of a list response, or [] if missing or null."""
+    result: list[Any] = response.get("result") or []
+    return result
+
+
+async def gather_bulk(
+    requests: list[Awaitable[Any]],
+    *,
+    concurrency: int,
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """Await bulk requests with bounded concurrency.
+
+    Returns the successful results and an error entry (with the item's index)
+    for each request the API rejected.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(request: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await request
+
+    results = await asyncio.gather(
+        *(bounded(request) for request in requests), return_exceptions=True
+    )
+
+    succeeded: list[Any] = []
+    errors: list[dict[str, Any]] = []
+    for index, result in enumerate(results):
+        if isinstance(result, UserError):
+            errors.append({"index": index, "error": str(result)})
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            succeeded.append(result)
+
+    return succeeded, errors
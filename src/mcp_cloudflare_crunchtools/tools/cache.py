@@ -6,7 +6,12 @@ Tools for purging Cloudflare cache.
 from typing import Any
 
 from ..client import get_client
-from ..models import validate_zone_id
+from ..models import CachePurgeInput, validate_zone_id
+from ._common import gather_bulk, result_object
+
+# Cloudflare accepts at most 30 URLs per purge request
+PURGE_BATCH_SIZE = 30
+PURGE_CONCURRENCY = 8
 
 
 async def purge_cache(
@@ -19,7 +24,7 @@ async def purge_cache(
 ) -> dict[str, Any]:
     """Purge cached content from Cloudflare's edge.
 
-    You can purge by:
+    Purge by exactly one of:
     - Everything (purge_everything=True)
     - Specific URLs (files)
     - Cache tags (tags) - requires Enterprise
@@ -29,13 +34,14 @@ async def purge_cache(
     Args:
         zone_id: Zone ID (32-character hex string)
         purge_everything: Purge all cached content (use with caution)
-        files: List of URLs to purge (max 30)
+        files: List of URLs to purge, at most 900 (sent in concurrent batches of 30)
         tags: List of cache tags to purge (Enterprise only)
         hosts: List of hostnames to purge (Enterprise only)
         prefixes: List of URL prefixes to purge (Enterprise only)
 
     Returns:
-        Purge operation result
+        Purge operation result, with the number of purge requests sent and an
+        error entry (with the batch index and its URLs) for each rejected batch
 
     Examples:
         # Purge everything
@@ -51,31 +57,61 @@ async def purge_cache(
         purge_cache(zone_id="...", tags=["static-assets", "images"])
     """
     zone_id = validate_zone_id(zone_id)
+
+    # Validate input using Pydantic model
+    purge_input = CachePurgeInput(
+        purge_everything=purge_everything,
+        files=files,
+        tags=tags,
+        hosts=hosts,
+        prefixes=prefixes,
+    )
+
     client = get_client()
 
-    body: dict[str, Any] = {}
-
-    if purge_everything:
-        body["purge_everything"] = True
-    elif files:
-        # Limit to 30 files per request
-        body["files"] = files[:30]
-    elif tags:
-        body["tags"] = tags[:30]
-    elif hosts:
-        body["hosts"] = hosts[:30]
-    elif prefixes:
-        body["prefixes"] = prefixes[:30]
-    else:
+    # Exactly one purge mode may be given; mixing them is ambiguous
+    modes = [
+        (mode, value)
+        for mode, value in (
+            ("purge_everything", purge_input.purge_everything),
+            ("files", purge_input.files),
+            ("tags", purge_input.tags),
+            ("hosts", purge_input.hosts),
+            ("prefixes", purge_input.prefixes),
+        )
+        if value
+    ]
+    if len(modes) != 1:
         return {
-            "error": "Must specify purge_everything, files, tags, hosts, or prefixes"
+            "error": "Specify exactly one of purge_everything, files, tags, hosts, or prefixes"
         }
 
-    response = await client.post(f"/zones/{zone_id}/purge_cache", json_data=body)
+    mode, value = modes[0]
+    bodies: list[dict[str, Any]]
+    if purge_input.files:
+        bodies = [
+            {"files": purge_input.files[i:i + PURGE_BATCH_SIZE]}
+            for i in range(0, len(purge_input.files), PURGE_BATCH_SIZE)
+        ]
+    else:
+        # CachePurgeInput caps tags, hosts, and prefixes at 30, so they fit in one request
+        bodies = [{mode: value}]
+
+    path = f"/zones/{zone_id}/purge_cache"
+
+    async def purge(body: dict[str, Any]) -> dict[str, Any]:
+        response = await client.post(path, json_data=body)
+        return result_object(response)
 
-    result = response.get("result", {})
+    purged, errors = await gather_bulk(
+        [purge(body) for body in bodies], concurrency=PURGE_CONCURRENCY
+    )
+    for error in errors:
+        error.update(bodies[error["index"]])
 
     return {
-        "success": response.get("success", False),
-        "id": result.get("id"),
+        "success": not errors,
+        "id": purged[0].get("id") if purged else None,
+        "batches": len(bodies),
+        "errors": errors,
     }
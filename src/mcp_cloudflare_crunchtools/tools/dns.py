@@ -3,15 +3,63 @@
 Tools for CRUD operations on Cloudflare DNS records.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from ..client import get_client
 from ..models import (
+    DNS_RECORD_TYPES,
     DnsRecordInput,
     DnsRecordUpdateInput,
     validate_record_id,
     validate_zone_id,
 )
+from ._common import gather_bulk, result_list, result_object
+
+# Bulk operations: records accepted per call, and requests in flight at once
+BULK_MAX_RECORDS = 100
+BULK_CONCURRENCY = 16
+
+# Validates a whole batch at once, so errors are located by record index
+_RECORD_LIST_ADAPTER = TypeAdapter(list[DnsRecordInput])
+
+
+def _record_body(record_input: DnsRecordInput) -> dict[str, Any]:
+    """Build the API request body for a validated DNS record."""
+    body: dict[str, Any] = {
+        "type": record_input.type,
+        "name": record_input.name,
+        "content": record_input.content,
+        "ttl": record_input.ttl,
+        "proxied": record_input.proxied,
+    }
+
+    if record_input.priority is not None:
+        body["priority"] = record_input.priority
+    if record_input.comment:
+        body["comment"] = record_input.comment
+
+    return body
+
+
+def _filter_params(
+    type: str | None,
+    name: str | None,
+    content: str | None,
+) -> dict[str, Any]:
+    """Build the query parameters for DNS record list filters."""
+    params: dict[str, Any] = {}
+
+    if type:
+        params["type"] = type if type in DNS_RECORD_TYPES else type.upper()
+    if name:
+        params["name"] = name
+    if content:
+        params["content"] = content
+
+    return params
 
 
 async def list_dns_records(
@@ -41,23 +89,80 @@ async def list_dns_records(
     params: dict[str, Any] = {
         "page": page,
         "per_page": min(per_page, 100),
+        **_filter_params(type, name, content),
     }
 
-    if type:
-        params["type"] = type.upper()
-    if name:
-        params["name"] = name
-    if content:
-        params["content"] = content
-
     response = await client.get(f"/zones/{zone_id}/dns_records", params=params)
 
     return {
-        "records": response.get("result", []),
+        "records": result_list(response),
         "result_info": response.get("result_info", {}),
     }
 
 
+async def list_all_dns_records(
+    zone_id: str,
+    type: str | None = None,
+    name: str | None = None,
+    content: str | None = None,
+) -> dict[str, Any]:
+    """List every DNS record for a zone across all pages.
+
+    Pages after the first are fetched concurrently.
+
+    Args:
+        zone_id: Zone ID (32-character hex string)
+        type: Filter by record type (A, AAAA, CNAME, MX, TXT, etc.)
+        name: Filter by record name
+        content: Filter by record content
+
+    Returns:
+        Dictionary containing all matching DNS records and their count
+    """
+    zone_id = validate_zone_id(zone_id)
+    client = get_client()
+
+    params = _filter_params(type, name, content)
+    records = await client.list_all(f"/zones/{zone_id}/dns_records", params=params)
+
+    return {
+        "records": records,
+        "count": len(records),
+    }
+
+
+async def iter_dns_records(
+    zone_id: str,
+    type: str | None = None,
+    name: str | None = None,
+    content: str | None = None,
+    per_page: int = 100,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every DNS record for a zone, fetching one page at a time.
+
+    For processing very large zones without holding all records in memory.
+    This is a helper for Python callers, not an MCP tool.
+
+    Args:
+        zone_id: Zone ID (32-character hex string)
+        type: Filter by record type (A, AAAA, CNAME, MX, TXT, etc.)
+        name: Filter by record name
+        content: Filter by record content
+        per_page: Number of records per page (max 100)
+
+    Yields:
+        DNS records, in page order
+    """
+    zone_id = validate_zone_id(zone_id)
+    client = get_client()
+
+    params = _filter_params(type, name, content)
+    async for record in client.iter_all(
+        f"/zones/{zone_id}/dns_records", params=params, per_page=min(per_page, 100)
+    ):
+        yield record
+
+
 async def get_dns_record(
     zone_id: str,
     record_id: str,
@@ -77,7 +182,7 @@ async def get_dns_record(
 
     response = await client.get(f"/zones/{zone_id}/dns_records/{record_id}")
 
-    return {"record": response.get("result", {})}
+    return {"record": result_object(response)}
 
 
 async def create_dns_record(
@@ -120,23 +225,54 @@ async def create_dns_record(
 
     client = get_client()
 
-    # Build request body
-    body: dict[str, Any] = {
-        "type": record_input.type,
-        "name": record_input.name,
-        "content": record_input.content,
-        "ttl": record_input.ttl,
-        "proxied": record_input.proxied,
-    }
-
-    if record_input.priority is not None:
-        body["priority"] = record_input.priority
-    if record_input.comment:
-        body["comment"] = record_input.comment
+    body = _record_body(record_input)
 
     response = await client.post(f"/zones/{zone_id}/dns_records", json_data=body)
 
-    return {"record": response.get("result", {})}
+    return {"record": result_object(response)}
+
+
+async def create_dns_records(
+    zone_id: str,
+    records: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Create several DNS records concurrently.
+
+    Every record is validated before any request is sent. Records the API
+    rejects are reported in errors without failing the rest.
+
+    Args:
+        zone_id: Zone ID (32-character hex string)
+        records: Record definitions with the same fields as create_dns_record
+            (type, name, content, ttl, proxied, priority, comment)
+
+    Returns:
+        Dictionary containing the created records and per-record errors
+    """
+    zone_id = validate_zone_id(zone_id)
+
+    if len(records) > BULK_MAX_RECORDS:
+        return {"error": f"At most {BULK_MAX_RECORDS} records can be created per call"}
+
+    # Validate input using Pydantic model
+    record_inputs = _RECORD_LIST_ADAPTER.validate_python(records)
+
+    client = get_client()
+    path = f"/zones/{zone_id}/dns_records"
+
+    async def create(record_input: DnsRecordInput) -> dict[str, Any]:
+        response = await client.post(path, json_data=_record_body(record_input))
+        return result_object(response)
+
+    created, errors = await gather_bulk(
+        [create(record_input) for record_input in record_inputs],
+        concurrency=BULK_CONCURRENCY,
+    )
+
+    return {
+        "created": created,
+        "errors": errors,
+    }
 
 
 async def update_dns_record(
@@ -169,6 +305,10 @@ async def update_dns_record(
     zone_id = validate_zone_id(zone_id)
     record_id = validate_record_id(record_id)
 
+    fields = (type, name, content, ttl, proxied, priority, comment)
+    if all(field is None for field in fields):
+        return {"error": "No fields provided for update"}
+
     # Validate input using Pydantic model
     update_input = DnsRecordUpdateInput(
         type=type,
@@ -183,29 +323,11 @@ async def update_dns_record(
     client = get_client()
 
     # Build request body with only provided fields
-    body: dict[str, Any] = {}
-
-    if update_input.type is not None:
-        body["type"] = update_input.type
-    if update_input.name is not None:
-        body["name"] = update_input.name
-    if update_input.content is not None:
-        body["content"] = update_input.content
-    if update_input.ttl is not None:
-        body["ttl"] = update_input.ttl
-    if update_input.proxied is not None:
-        body["proxied"] = update_input.proxied
-    if update_input.priority is not None:
-        body["priority"] = update_input.priority
-    if update_input.comment is not None:
-        body["comment"] = update_input.comment
-
-    if not body:
-        return {"error": "No fields provided for update"}
+    body = update_input.model_dump(exclude_none=True)
 
     response = await client.patch(f"/zones/{zone_id}/dns_records/{record_id}", json_data=body)
 
-    return {"record": response.get("result", {})}
+    return {"record": result_object(response)}
 
 
 async def delete_dns_record(
@@ -229,5 +351,46 @@ async def delete_dns_record(
 
     return {
         "deleted": True,
-        "id": response.get("result", {}).get("id", record_id),
+        "id": result_object(response).get("id", record_id),
+    }
+
+
+async def delete_dns_records(
+    zone_id: str,
+    record_ids: list[str],
+) -> dict[str, Any]:
+    """Delete several DNS records concurrently.
+
+    Every record ID is validated before any request is sent. Records the API
+    fails to delete are reported in errors without failing the rest.
+
+    Args:
+        zone_id: Zone ID (32-character hex string)
+        record_ids: DNS record IDs (32-character hex strings)
+
+    Returns:
+        Dictionary containing the deleted record IDs and per-record errors
+    """
+    zone_id = validate_zone_id(zone_id)
+
+    if len(record_ids) > BULK_MAX_RECORDS:
+        return {"error": f"At most {BULK_MAX_RECORDS} records can be deleted per call"}
+
+    record_ids = [validate_record_id(record_id) for record_id in record_ids]
+
+    client = get_client()
+
+    async def delete(record_id: str) -> str:
+        response = await client.delete(f"/zones/{zone_id}/dns_records/{record_id}")
+        deleted_id: str = result_object(response).get("id", record_id)
+        return deleted_id
+
+    deleted, errors = await gather_bulk(
+        [delete(record_id) for record_id in record_ids],
+        concurrency=BULK_CONCURRENCY,
+    )
+
+    return {
+        "deleted": deleted,
+        "errors": errors,
     }
@@ -6,7 +6,8 @@ Tools for managing Cloudflare Page Rules.
 from typing import Any
 
 from ..client import get_client
-from ..models import validate_rule_id, validate_zone_id
+from ..models import PageRuleInput, validate_rule_id, validate_zone_id
+from ._common import result_list, result_object
 
 
 async def list_page_rules(
@@ -37,7 +38,7 @@ async def list_page_rules(
     response = await client.get(f"/zones/{zone_id}/pagerules", params=params)
 
     return {
-        "page_rules": response.get("result", []),
+        "page_rules": result_list(response),
     }
 
 
@@ -72,18 +73,22 @@ async def create_page_rule(
     - ssl: Set SSL mode (off, flexible, full, strict)
     """
     zone_id = validate_zone_id(zone_id)
-    client = get_client()
 
-    body = {
+    # Validate input using Pydantic model
+    rule_input = PageRuleInput.model_validate({
         "targets": targets,
         "actions": actions,
         "priority": priority,
         "status": status,
-    }
+    })
+
+    client = get_client()
+
+    body = rule_input.model_dump(exclude_unset=True)
 
     response = await client.post(f"/zones/{zone_id}/pagerules", json_data=body)
 
-    return {"page_rule": response.get("result", {})}
+    return {"page_rule": result_object(response)}
 
 
 async def update_page_rule(
@@ -109,25 +114,25 @@ async def update_page_rule(
     """
     zone_id = validate_zone_id(zone_id)
     rule_id = validate_rule_id(rule_id)
-    client = get_client()
-
-    body: dict[str, Any] = {}
 
-    if targets is not None:
-        body["targets"] = targets
-    if actions is not None:
-        body["actions"] = actions
-    if priority is not None:
-        body["priority"] = priority
-    if status is not None:
-        body["status"] = status
+    body = {
+        key: value
+        for key, value in (
+            ("targets", targets),
+            ("actions", actions),
+            ("priority", priority),
+            ("status", status),
+        )
+        if value is not None
+    }
 
     if not body:
         return {"error": "No fields provided for update"}
 
+    client = get_client()
     response = await client.patch(f"/zones/{zone_id}/pagerules/{rule_id}", json_data=body)
 
-    return {"page_rule": response.get("result", {})}
+    return {"page_rule": result_object(response)}
 
 
 async def delete_page_rule(
@@ -151,5 +156,5 @@ async def delete_page_rule(
 
     return {
         "deleted": True,
-        "id": response.get("result", {}).get("id", rule_id),
+        "id": result_object(response).get("id", rule_id),
     }
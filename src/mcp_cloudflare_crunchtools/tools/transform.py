@@ -7,32 +7,58 @@ response headers, and URL rewrites.
 from typing import Any
 
 from ..client import get_client
+from ..errors import ZoneNotFoundError
 from ..models import validate_zone_id
+from ._common import result_object
 
 # Cloudflare ruleset phases for transform rules
 PHASE_REQUEST_HEADERS = "http_request_late_transform"
 PHASE_RESPONSE_HEADERS = "http_response_headers_transform"
 PHASE_URL_REWRITE = "http_request_transform"
 
+# Cloudflare error code for a phase that has no entry point ruleset yet
+ENTRYPOINT_NOT_FOUND_CODE = 10003
 
-async def _get_ruleset(zone_id: str, phase: str) -> dict[str, Any]:
-    """Get or create a ruleset for a specific phase."""
-    client = get_client()
+# Fields Cloudflare adds to stored rules, ignored when comparing rule lists
+_SERVER_RULE_FIELDS = frozenset({"id", "version", "ref", "last_updated"})
+
+# Defaults Cloudflare fills in for fields a submitted rule may omit
+_RULE_DEFAULTS: dict[str, Any] = {"enabled": True, "description": ""}
+
+
+def _entrypoint_path(zone_id: str, phase: str) -> str:
+    """Build the path of a zone's entry point ruleset for a phase."""
+    return f"/zones/{zone_id}/rulesets/phases/{phase}/entrypoint"
 
-    # List rulesets to find the one for this phase
-    response = await client.get(f"/zones/{zone_id}/rulesets")
-    rulesets = response.get("result", [])
 
-    for ruleset in rulesets:
-        if ruleset.get("phase") == phase:
-            # Get full ruleset with rules
-            ruleset_id = ruleset["id"]
-            ruleset_response = await client.get(f"/zones/{zone_id}/rulesets/{ruleset_id}")
-            result: dict[str, Any] = ruleset_response.get("result", {})
-            return result
+def _comparable_rules(rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Normalize rules so submitted and stored versions compare equal.
+
+    Server-assigned fields are dropped and omitted fields get their defaults.
+    """
+    return [
+        _RULE_DEFAULTS
+        | {key: value for key, value in rule.items() if key not in _SERVER_RULE_FIELDS}
+        for rule in rules
+    ]
 
-    # No ruleset found for this phase
-    return {}
+
+async def _get_ruleset(
+    zone_id: str, phase: str, *, cache: bool = True
+) -> dict[str, Any]:
+    """Get the ruleset for a specific phase, or {} if none exists."""
+    client = get_client()
+
+    # The entry point ruleset does not exist until rules are first set. Any
+    # other 404 (e.g. an unknown zone) is a real error.
+    try:
+        response = await client.get(_entrypoint_path(zone_id, phase), cache=cache)
+    except ZoneNotFoundError as e:
+        if e.code != ENTRYPOINT_NOT_FOUND_CODE:
+            raise
+        return {}
+
+    return result_object(response)
 
 
 async def _update_ruleset(
@@ -40,41 +66,24 @@ async def _update_ruleset(
     phase: str,
     rules: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    """Update or create a ruleset for a specific phase."""
-    client = get_client()
+    """Replace the rules of a phase, creating its ruleset if needed.
 
-    # Check if ruleset exists
-    response = await client.get(f"/zones/{zone_id}/rulesets")
-    rulesets = response.get("result", [])
+    The PUT is skipped when the phase already holds exactly these rules.
+    """
+    client = get_client()
 
-    existing_ruleset_id = None
-    for ruleset in rulesets:
-        if ruleset.get("phase") == phase:
-            existing_ruleset_id = ruleset["id"]
-            break
+    # Read the live ruleset; a cached copy could hide a change made elsewhere
+    current = await _get_ruleset(zone_id, phase, cache=False)
+    if current and _comparable_rules(current.get("rules", [])) == _comparable_rules(rules):
+        return current
 
     body: dict[str, Any] = {
         "rules": rules,
     }
 
-    if existing_ruleset_id:
-        # Update existing ruleset
-        response = await client.put(
-            f"/zones/{zone_id}/rulesets/{existing_ruleset_id}",
-            json_data=body,
-        )
-    else:
-        # Create new ruleset
-        body["name"] = f"MCP Managed {phase}"
-        body["kind"] = "zone"
-        body["phase"] = phase
-        response = await client.post(
-            f"/zones/{zone_id}/rulesets",
-            json_data=body,
-        )
-
-    result: dict[str, Any] = response.get("result", {})
-    return result
+    response = await client.put(_entrypoint_path(zone_id, phase), json_data=body)
+
+    return result_object(response)
 
 
 # Request Header Rules
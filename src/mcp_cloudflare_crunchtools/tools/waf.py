@@ -10,6 +10,7 @@ from typing import Any
 
 from ..client import get_client
 from ..models import validate_rule_id, validate_zone_id
+from ._common import result_list, result_object
 
 WAF_PHASE = "http_request_firewall_custom"
 
@@ -26,14 +27,20 @@ VALID_ACTIONS = frozenset({
 
 async def _get_waf_ruleset(
     zone_id: str,
+    *,
+    cache: bool = True,
 ) -> dict[str, Any] | None:
-    """Find the custom WAF ruleset for a zone, if it exists."""
+    """Find the custom WAF ruleset for a zone, if it exists.
+
+    Callers about to write pass cache=False so they act on the live ruleset.
+    """
     client = get_client()
     response = await client.get(
         f"/zones/{zone_id}/rulesets",
         params={"phase": WAF_PHASE},
+        cache=cache,
     )
-    for ruleset in response.get("result", []):
+    for ruleset in result_list(response):
         if ruleset.get("phase") == WAF_PHASE and ruleset.get("kind") == "zone":
             result: dict[str, Any] = ruleset
             return result
@@ -60,7 +67,7 @@ async def list_waf_rules(zone_id: str) -> dict[str, Any]:
     response = await client.get(
         f"/zones/{zone_id}/rulesets/{ruleset['id']}"
     )
-    result = response.get("result", {})
+    result = result_object(response)
 
     rules = []
     for rule in result.get("rules", []):
@@ -109,7 +116,7 @@ async def create_waf_rule(
         return {"error": f"Invalid action. Must be one of: {', '.join(sorted(VALID_ACTIONS))}"}
 
     client = get_client()
-    ruleset = await _get_waf_ruleset(zone_id)
+    ruleset = await _get_waf_ruleset(zone_id, cache=False)
 
     rule_data = {
         "expression": expression,
@@ -137,7 +144,7 @@ async def create_waf_rule(
             },
         )
 
-    result = response.get("result", {})
+    result = result_object(response)
     rules = result.get("rules", [])
 
     # Return the last rule (the one just created)
@@ -184,7 +191,7 @@ async def update_waf_rule(
         return {"error": f"Invalid action. Must be one of: {', '.join(sorted(VALID_ACTIONS))}"}
 
     client = get_client()
-    ruleset = await _get_waf_ruleset(zone_id)
+    ruleset = await _get_waf_ruleset(zone_id, cache=False)
     if not ruleset:
         return {"error": "No custom WAF ruleset found for this zone"}
 
@@ -206,7 +213,7 @@ async def update_waf_rule(
         json_data=update_data,
     )
 
-    result = response.get("result", {})
+    result = result_object(response)
 
     # Find the updated rule in the response
     updated_rule = {}
@@ -243,7 +250,7 @@ async def delete_waf_rule(
     rule_id = validate_rule_id(rule_id)
     client = get_client()
 
-    ruleset = await _get_waf_ruleset(zone_id)
+    ruleset = await _get_waf_ruleset(zone_id, cache=False)
     if not ruleset:
         return {"error": "No custom WAF ruleset found for this zone"}
 
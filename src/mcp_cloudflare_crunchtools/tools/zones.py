@@ -7,6 +7,7 @@ from typing import Any
 
 from ..client import get_client
 from ..models import validate_zone_id
+from ._common import result_list, result_object
 
 
 async def list_zones(
@@ -41,7 +42,7 @@ async def list_zones(
     response = await client.get("/zones", params=params)
 
     return {
-        "zones": response.get("result", []),
+        "zones": result_list(response),
         "result_info": response.get("result_info", {}),
     }
 
@@ -61,17 +62,17 @@ async def get_zone(
 
     Note:
         Provide either zone_id or zone_name, not both.
-        If zone_name is provided, a lookup will be performed first.
+        If zone_name is provided, the zone is looked up by name.
     """
     client = get_client()
 
-    # If zone_name provided, look up the zone_id first
+    # The name lookup already returns full zone objects
     if zone_name and not zone_id:
         zones_response = await client.get("/zones", params={"name": zone_name})
-        zones = zones_response.get("result", [])
+        zones = result_list(zones_response)
         if not zones:
             return {"error": f"Zone not found: {zone_name}"}
-        zone_id = zones[0]["id"]
+        return {"zone": zones[0]}
 
     if not zone_id:
         return {"error": "Either zone_id or zone_name must be provided"}
@@ -81,4 +82,4 @@ async def get_zone(
 
     response = await client.get(f"/zones/{zone_id}")
 
-    return {"zone": response.get("result", {})}
+    return {"zone": result_object(response)}
@@ -9,19 +9,57 @@ from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
+from pydantic import TypeAdapter
+
+from mcp_cloudflare_crunchtools.models import DnsRecordInput, DnsRecordUpdateInput, ZoneInput
 
 
 @pytest.fixture(autouse=True)
 def _reset_client_singleton() -> Generator[None, None, None]:
-    """Reset the Cloudflare client and config singletons between tests."""
-    import mcp_cloudflare_crunchtools.client as client_mod
-    import mcp_cloudflare_crunchtools.config as config_mod
+    """Reset the Cloudflare client and config singletons between tests.
+
+    Both are memoized with functools.cache, so clearing the cache drops them.
+    """
+    from mcp_cloudflare_crunchtools.client import get_client
+    from mcp_cloudflare_crunchtools.config import get_config
 
-    client_mod._client = None
-    config_mod._config = None
+    get_client.cache_clear()
+    get_config.cache_clear()
     yield
-    client_mod._client = None
-    config_mod._config = None
+    get_client.cache_clear()
+    get_config.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def zone_ta() -> TypeAdapter[ZoneInput]:
+    """ZoneInput validator, built once for the whole session."""
+    return TypeAdapter(ZoneInput)
+
+
+@pytest.fixture(scope="session")
+def dns_ta() -> TypeAdapter[DnsRecordInput]:
+    """DnsRecordInput validator, built once for the whole session."""
+    return TypeAdapter(DnsRecordInput)
+
+
+@pytest.fixture(scope="session")
+def dns_list_ta() -> TypeAdapter[list[DnsRecordInput]]:
+    """Validator for a batch of DnsRecordInput, built once for the whole session."""
+    return TypeAdapter(list[DnsRecordInput])
+
+
+@pytest.fixture(scope="session")
+def dns_update_ta() -> TypeAdapter[DnsRecordUpdateInput]:
+    """DnsRecordUpdateInput validator, built once for the whole session."""
+    return TypeAdapter(DnsRecordUpdateInput)
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry failed requests immediately so error-path tests stay fast."""
+    from mcp_cloudflare_crunchtools import client
+
+    monkeypatch.setattr(client, "RETRY_BACKOFF_BASE", 0.0)
 
 
 def _mock_cf_response(
@@ -39,11 +77,22 @@ def _mock_cf_response(
     )
 
 
+def _mock_cf_page(number: int, total_pages: int = 3) -> httpx.Response:
+    """Build one page of a mock paginated list response with a single record."""
+    return _mock_cf_response(
+        json_data={
+            "success": True,
+            "result": [{"id": f"{number:032x}", "type": "A"}],
+            "result_info": {"page": number, "total_pages": total_pages},
+        }
+    )
+
+
 @asynccontextmanager
 async def _patch_cf_client(
     response: httpx.Response | None = None,
 ) -> AsyncIterator[AsyncMock]:
-    """Patch httpx.AsyncClient to return mock Cloudflare responses."""
+    """Patch httpx.AsyncClient.send to return mock Cloudflare responses."""
     env = {
         "CLOUDFLARE_API_TOKEN": "test_token_abc123",
     }
@@ -54,6 +103,6 @@ async def _patch_cf_client(
         mock_method.return_value = _mock_cf_response()
 
     with patch.dict(os.environ, env, clear=True), patch(
-        "httpx.AsyncClient.request", mock_method
+        "httpx.AsyncClient.send", mock_method
     ):
         yield mock_method
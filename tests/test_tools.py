@@ -1,7 +1,16 @@
 """Mocked tool tests for all 25 Cloudflare tools."""
 
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
 import pytest
+from pydantic import ValidationError as PydanticValidationError
 
+from mcp_cloudflare_crunchtools.client import MAX_RETRIES, CloudflareClient, get_client
 from mcp_cloudflare_crunchtools.errors import (
     CloudflareApiError,
     ConfigurationError,
@@ -14,12 +23,15 @@ from mcp_cloudflare_crunchtools.errors import (
     ValidationError,
     ZoneNotFoundError,
 )
+from mcp_cloudflare_crunchtools.ratelimit import AsyncTokenBucket
 from mcp_cloudflare_crunchtools.tools import __all__ as tools_all
 from mcp_cloudflare_crunchtools.tools import (
     create_dns_record,
+    create_dns_records,
     create_page_rule,
     create_waf_rule,
     delete_dns_record,
+    delete_dns_records,
     delete_page_rule,
     delete_waf_rule,
     get_dns_record,
@@ -28,6 +40,7 @@ from mcp_cloudflare_crunchtools.tools import (
     get_traffic_by_country,
     get_zone,
     get_zone_analytics,
+    list_all_dns_records,
     list_dns_records,
     list_page_rules,
     list_request_header_rules,
@@ -43,16 +56,21 @@ from mcp_cloudflare_crunchtools.tools import (
     update_page_rule,
     update_waf_rule,
 )
-from tests.conftest import _mock_cf_response, _patch_cf_client
+from mcp_cloudflare_crunchtools.tools.dns import iter_dns_records
+from mcp_cloudflare_crunchtools.tools.waf import WAF_PHASE
+from tests.conftest import _mock_cf_page, _mock_cf_response, _patch_cf_client
 
 TOOL_FUNCTIONS = [
     list_zones,
     get_zone,
     list_dns_records,
+    list_all_dns_records,
     get_dns_record,
     create_dns_record,
     update_dns_record,
     delete_dns_record,
+    create_dns_records,
+    delete_dns_records,
     list_request_header_rules,
     set_request_header_rules,
     list_response_header_rules,
@@ -74,8 +92,8 @@ TOOL_FUNCTIONS = [
     delete_waf_rule,
 ]
 
-EXPECTED_TOOL_COUNT = 26
-EXPECTED_ALL_COUNT = 26
+EXPECTED_TOOL_COUNT = 29
+EXPECTED_ALL_COUNT = 29
 
 ZONE_ID = "a" * 32
 RECORD_ID = "b" * 32
@@ -192,7 +210,7 @@ class TestConfigSafety:
         try:
             import mcp_cloudflare_crunchtools.config as config_module
 
-            config_module._config = None
+            config_module.get_config.cache_clear()
             with pytest.raises(ConfigurationError):
                 Config()
         finally:
@@ -200,6 +218,353 @@ class TestConfigSafety:
                 os.environ["CLOUDFLARE_API_TOKEN"] = token
 
 
+# =============================================================================
+# Client Tests
+# =============================================================================
+
+
+class TestClientLifecycle:
+    """Tests for HTTP client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_pool(self) -> None:
+        async with _patch_cf_client():
+            async with CloudflareClient() as client:
+                assert client._client is not None
+            assert client._client is None
+
+
+class TestErrorResponses:
+    """Tests for mapping API error responses to exceptions."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status_code", "error_class"),
+        [
+            (401, PermissionDeniedError),
+            (403, PermissionDeniedError),
+            (404, ZoneNotFoundError),
+            (429, RateLimitError),
+            (500, CloudflareApiError),
+        ],
+    )
+    async def test_status_code_mapping(
+        self, status_code: int, error_class: type[UserError]
+    ) -> None:
+        resp = _mock_cf_response(
+            status_code,
+            json_data={"success": False, "errors": [{"code": 1000, "message": "failed"}]},
+        )
+        async with _patch_cf_client(response=resp):
+            with pytest.raises(error_class):
+                await list_zones()
+
+
+class TestRetries:
+    """Tests for retrying rate-limited and transient server failures."""
+
+    @pytest.mark.asyncio
+    async def test_get_retried_after_server_error(self) -> None:
+        failed = _mock_cf_response(503, json_data={"success": False, "errors": []})
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [failed, _mock_cf_response()]
+            result = await list_zones()
+            assert "zones" in result
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_after_server_error(self) -> None:
+        failed = _mock_cf_response(503, json_data={"success": False, "errors": []})
+        async with _patch_cf_client(response=failed) as mock_request:
+            result = await purge_cache(zone_id=ZONE_ID, purge_everything=True)
+            assert result["success"] is False
+            assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_post_retried(self) -> None:
+        limited = _mock_cf_response(429, json_data={"success": False, "errors": []})
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [limited, _mock_cf_response()]
+            result = await purge_cache(zone_id=ZONE_ID, purge_everything=True)
+            assert result["success"] is True
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_fails_fast(self) -> None:
+        limited = _mock_cf_response(429, json_data={"success": False, "errors": []})
+        limited.headers["retry-after"] = "120"
+        async with _patch_cf_client(response=limited) as mock_request:
+            start = time.monotonic()
+            with pytest.raises(RateLimitError, match="Retry after 12"):
+                await list_zones()
+            assert time.monotonic() - start < 1
+            assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retried_purge_takes_one_purge_token(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import mcp_cloudflare_crunchtools.client as client_mod
+
+        monkeypatch.setattr(client_mod, "PURGE_LIMIT_BURST", 2)
+        limited = _mock_cf_response(429, json_data={"success": False, "errors": []})
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [limited, limited, _mock_cf_response()]
+            result = await purge_cache(zone_id=ZONE_ID, tags=["static"])
+            assert result["success"] is True
+            assert mock_request.call_count == 3
+            assert get_client()._purge_limiter.wait_time() == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self) -> None:
+        limited = _mock_cf_response(429, json_data={"success": False, "errors": []})
+        async with _patch_cf_client(response=limited) as mock_request:
+            with pytest.raises(RateLimitError):
+                await list_zones()
+            assert mock_request.call_count == MAX_RETRIES + 1
+
+
+class TestResponseSizeLimit:
+    """Tests for response size enforcement."""
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_without_content_length(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import mcp_cloudflare_crunchtools.client as client_mod
+
+        monkeypatch.setattr(client_mod, "MAX_RESPONSE_SIZE", 16)
+        resp = _mock_cf_response()
+        del resp.headers["content-length"]
+        async with _patch_cf_client(response=resp):
+            with pytest.raises(CloudflareApiError, match="too large"):
+                await list_zones()
+
+
+class TestRateLimiter:
+    """Tests for the client-side token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_empty(self) -> None:
+        bucket = AsyncTokenBucket(rate=100.0, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.005
+
+    @pytest.mark.asyncio
+    async def test_wait_time_counts_queued_reservations(self) -> None:
+        bucket = AsyncTokenBucket(rate=1.0, capacity=1)
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        assert bucket.wait_time() > 1.5
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert bucket.wait_time() <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_tag_purge_fails_fast_when_budget_exhausted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import mcp_cloudflare_crunchtools.client as client_mod
+
+        monkeypatch.setattr(client_mod, "PURGE_LIMIT_BURST", 1)
+        async with _patch_cf_client() as mock_request:
+            await purge_cache(zone_id=ZONE_ID, tags=["static"])
+            start = time.monotonic()
+            result = await purge_cache(zone_id=ZONE_ID, tags=["static"])
+            assert "Retry after" in result["errors"][0]["error"]
+            assert time.monotonic() - start < 1
+            assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_request_fails_fast_when_bucket_drained(self) -> None:
+        async with _patch_cf_client() as mock_request:
+            get_client()._rate_limiter.drain(120.0)
+            start = time.monotonic()
+            with pytest.raises(RateLimitError, match="Retry after"):
+                await list_zones()
+            assert time.monotonic() - start < 1
+            mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_url_purges_not_limited_by_purge_budget(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import mcp_cloudflare_crunchtools.client as client_mod
+
+        monkeypatch.setattr(client_mod, "PURGE_LIMIT_BURST", 1)
+        async with _patch_cf_client() as mock_request:
+            for _ in range(3):
+                await purge_cache(zone_id=ZONE_ID, purge_everything=True)
+                await purge_cache(zone_id=ZONE_ID, files=["https://example.com/a.css"])
+            assert mock_request.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_drain_blocks_until_retry_after(self) -> None:
+        bucket = AsyncTokenBucket(rate=100.0, capacity=10)
+        bucket.drain(0.02)
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.02
+
+
+def _record_store_send(
+    records: list[dict[str, Any]], release: asyncio.Event
+) -> Callable[..., Awaitable[httpx.Response]]:
+    """Fake a DNS record store whose first GET is held until release is set.
+
+    The held GET snapshots the records when it is sent, like a request the
+    server answered before a concurrent write landed.
+    """
+    gets = 0
+
+    async def send(request: httpx.Request, **_kwargs: object) -> httpx.Response:
+        nonlocal gets
+        if request.method != "GET":
+            records.append({"id": RECORD_ID, "type": "A"})
+            return _mock_cf_response(json_data={"success": True, "result": records[-1]})
+        gets += 1
+        snapshot = list(records)
+        if gets == 1:
+            await release.wait()
+        return _mock_cf_response(json_data={"success": True, "result": snapshot})
+
+    return send
+
+
+class TestResponseCache:
+    """Tests for the GET response cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_served_from_cache(self) -> None:
+        async with _patch_cf_client() as mock_request:
+            await list_dns_records(zone_id=ZONE_ID)
+            await list_dns_records(zone_id=ZONE_ID)
+            assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_coalesced(self) -> None:
+        async def slow_send(*_args: object, **_kwargs: object) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return _mock_cf_response()
+
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = slow_send
+            results = await asyncio.gather(
+                *(list_dns_records(zone_id=ZONE_ID) for _ in range(3))
+            )
+            assert mock_request.call_count == 1
+            assert results[0] == results[1] == results[2]
+            assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        async def slow_send(*_args: object, **_kwargs: object) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return _mock_cf_response()
+
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = slow_send
+            leader = asyncio.create_task(list_dns_records(zone_id=ZONE_ID))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(list_dns_records(zone_id=ZONE_ID))
+            await asyncio.sleep(0)
+            leader.cancel()
+            result = await follower
+            assert leader.cancelled()
+            assert "records" in result
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_large_body_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import mcp_cloudflare_crunchtools.client as client_mod
+
+        monkeypatch.setattr(client_mod, "GET_CACHE_MAX_ENTRY_BYTES", 10)
+        async with _patch_cf_client() as mock_request:
+            await list_dns_records(zone_id=ZONE_ID)
+            await list_dns_records(zone_id=ZONE_ID)
+            assert mock_request.call_count == 2
+            assert get_client()._cache_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_evicts_oldest(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import mcp_cloudflare_crunchtools.client as client_mod
+
+        monkeypatch.setattr(client_mod, "GET_CACHE_MAX_BYTES", 100)
+        async with _patch_cf_client() as mock_request:
+            await list_dns_records(zone_id=ZONE_ID)
+            await get_zone(zone_id=ZONE_ID)
+            await list_dns_records(zone_id=ZONE_ID)
+            assert mock_request.call_count == 3
+            assert get_client()._cache_bytes <= 100
+
+    @pytest.mark.asyncio
+    async def test_get_racing_a_write_is_not_cached(self) -> None:
+        records: list[dict[str, Any]] = []
+        release = asyncio.Event()
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = _record_store_send(records, release)
+            stale = asyncio.create_task(list_dns_records(zone_id=ZONE_ID))
+            await asyncio.sleep(0.01)
+            await create_dns_record(
+                zone_id=ZONE_ID, type="A", name="www", content="192.0.2.1"
+            )
+            release.set()
+            assert (await stale)["records"] == []
+            result = await list_dns_records(zone_id=ZONE_ID)
+            assert len(result["records"]) == 1
+            assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_after_write_not_coalesced_with_earlier_get(self) -> None:
+        records: list[dict[str, Any]] = []
+        release = asyncio.Event()
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = _record_store_send(records, release)
+            stale = asyncio.create_task(list_dns_records(zone_id=ZONE_ID))
+            await asyncio.sleep(0.01)
+            await create_dns_record(
+                zone_id=ZONE_ID, type="A", name="www", content="192.0.2.1"
+            )
+            fresh = asyncio.create_task(list_dns_records(zone_id=ZONE_ID))
+            await asyncio.sleep(0.01)
+            release.set()
+            assert (await stale)["records"] == []
+            assert len((await fresh)["records"]) == 1
+            assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_zone_cache(self) -> None:
+        async with _patch_cf_client() as mock_request:
+            await list_dns_records(zone_id=ZONE_ID)
+            await delete_dns_record(zone_id=ZONE_ID, record_id=RECORD_ID)
+            await list_dns_records(zone_id=ZONE_ID)
+            assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_etag(self) -> None:
+        resp = _mock_cf_response(
+            json_data={"success": True, "result": {"id": ZONE_ID, "name": "example.com"}}
+        )
+        resp.headers["etag"] = '"v1"'
+        not_modified = httpx.Response(
+            304, request=httpx.Request("GET", "https://api.cloudflare.com/client/v4")
+        )
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [resp, not_modified]
+            await get_zone(zone_id=ZONE_ID)
+            client = get_client()
+            for key, entry in client._cache.items():
+                client._cache[key] = entry._replace(expires_at=0.0)
+            result = await get_zone(zone_id=ZONE_ID)
+            assert result["zone"]["name"] == "example.com"
+            request = mock_request.call_args.args[0]
+            assert request.headers["If-None-Match"] == '"v1"'
+
+
 # =============================================================================
 # Mocked API Tests — Zone Tools
 # =============================================================================
@@ -236,6 +601,19 @@ class TestZoneTools:
             assert "zone" in result
             assert result["zone"]["name"] == "example.com"
 
+    @pytest.mark.asyncio
+    async def test_get_zone_by_name_single_request(self) -> None:
+        resp = _mock_cf_response(
+            json_data={
+                "success": True,
+                "result": [{"id": ZONE_ID, "name": "example.com", "status": "active"}],
+            }
+        )
+        async with _patch_cf_client(response=resp) as mock_request:
+            result = await get_zone(zone_name="example.com")
+            assert result["zone"]["id"] == ZONE_ID
+            assert mock_request.call_count == 1
+
 
 # =============================================================================
 # Mocked API Tests — DNS Tools
@@ -262,6 +640,28 @@ class TestDnsTools:
             assert len(result["records"]) == 1
             assert result["records"][0]["type"] == "A"
 
+    @pytest.mark.asyncio
+    async def test_list_all_dns_records(self) -> None:
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [_mock_cf_page(n) for n in (1, 2, 3)]
+            result = await list_all_dns_records(zone_id=ZONE_ID)
+            assert result["count"] == 3
+            assert [r["id"] for r in result["records"]] == [f"{n:032x}" for n in (1, 2, 3)]
+            assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_dns_records_stops_early(self) -> None:
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [_mock_cf_page(n) for n in (1, 2, 3)]
+            ids = []
+            async for record in iter_dns_records(zone_id=ZONE_ID):
+                ids.append(record["id"])
+                if len(ids) == 2:
+                    break
+            assert ids == [f"{n:032x}" for n in (1, 2)]
+            assert mock_request.call_count == 2
+            assert get_client()._cache == {}
+
     @pytest.mark.asyncio
     async def test_get_dns_record(self) -> None:
         resp = _mock_cf_response(
@@ -312,11 +712,19 @@ class TestDnsTools:
                 },
             }
         )
-        async with _patch_cf_client(response=resp):
+        async with _patch_cf_client(response=resp) as mock_request:
             result = await update_dns_record(
                 zone_id=ZONE_ID, record_id=RECORD_ID, content="9.8.7.6"
             )
             assert "record" in result
+            assert json.loads(mock_request.call_args.args[0].content) == {"content": "9.8.7.6"}
+
+    @pytest.mark.asyncio
+    async def test_update_dns_record_without_fields(self) -> None:
+        async with _patch_cf_client() as mock_request:
+            result = await update_dns_record(zone_id=ZONE_ID, record_id=RECORD_ID)
+            assert "error" in result
+            mock_request.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_delete_dns_record(self) -> None:
@@ -330,6 +738,53 @@ class TestDnsTools:
             result = await delete_dns_record(zone_id=ZONE_ID, record_id=RECORD_ID)
             assert result.get("deleted") is True
 
+    @pytest.mark.asyncio
+    async def test_delete_dns_record_null_result(self) -> None:
+        resp = _mock_cf_response(json_data={"success": True, "result": None})
+        async with _patch_cf_client(response=resp):
+            result = await delete_dns_record(zone_id=ZONE_ID, record_id=RECORD_ID)
+            assert result["id"] == RECORD_ID
+
+    @pytest.mark.asyncio
+    async def test_create_dns_records_reports_per_record_errors(self) -> None:
+        created = _mock_cf_response(
+            json_data={"success": True, "result": {"id": RECORD_ID, "type": "A"}}
+        )
+        rejected = _mock_cf_response(
+            status_code=400,
+            json_data={"success": False, "errors": [{"code": 81057, "message": "exists"}]},
+        )
+        records = [
+            {"type": "A", "name": "a.example.com", "content": "1.2.3.4"},
+            {"type": "A", "name": "b.example.com", "content": "1.2.3.5"},
+        ]
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [created, rejected]
+            result = await create_dns_records(zone_id=ZONE_ID, records=records)
+            assert [record["id"] for record in result["created"]] == [RECORD_ID]
+            assert result["errors"][0]["index"] == 1
+
+    @pytest.mark.asyncio
+    async def test_create_dns_records_validates_before_sending(self) -> None:
+        records = [
+            {"type": "A", "name": "a.example.com", "content": "1.2.3.4"},
+            {"type": "INVALID", "name": "b.example.com", "content": "1.2.3.5"},
+        ]
+        async with _patch_cf_client() as mock_request:
+            with pytest.raises(PydanticValidationError) as exc_info:
+                await create_dns_records(zone_id=ZONE_ID, records=records)
+            assert exc_info.value.errors()[0]["loc"][:2] == (1, "type")
+            mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_dns_records(self) -> None:
+        record_ids = ["c" * 32, "d" * 32]
+        async with _patch_cf_client() as mock_request:
+            result = await delete_dns_records(zone_id=ZONE_ID, record_ids=record_ids)
+            assert sorted(result["deleted"]) == record_ids
+            assert result["errors"] == []
+            assert mock_request.call_count == 2
+
 
 # =============================================================================
 # Mocked API Tests — Cache Tools
@@ -351,6 +806,55 @@ class TestCacheTools:
             result = await purge_cache(zone_id=ZONE_ID, purge_everything=True)
             assert result["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_purge_cache_batches_files(self) -> None:
+        files = [f"https://example.com/{i}.css" for i in range(65)]
+        async with _patch_cf_client() as mock_request:
+            result = await purge_cache(zone_id=ZONE_ID, files=files)
+            assert result["batches"] == 3
+            assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_purge_cache_reports_per_batch_errors(self) -> None:
+        files = [f"https://example.com/{i}.css" for i in range(45)]
+        purged = _mock_cf_response(
+            json_data={"success": True, "result": {"id": "purge123"}}
+        )
+        rejected = _mock_cf_response(
+            status_code=400,
+            json_data={"success": False, "errors": [{"code": 1012, "message": "bad url"}]},
+        )
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [purged, rejected]
+            result = await purge_cache(zone_id=ZONE_ID, files=files)
+            assert result["success"] is False
+            assert result["id"] == "purge123"
+            assert result["errors"][0]["index"] == 1
+            assert result["errors"][0]["files"] == files[30:]
+
+    @pytest.mark.asyncio
+    async def test_purge_cache_rejects_too_many_files(self) -> None:
+        files = [f"https://example.com/{i}.css" for i in range(901)]
+        async with _patch_cf_client() as mock_request:
+            with pytest.raises(PydanticValidationError):
+                await purge_cache(zone_id=ZONE_ID, files=files)
+            mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_purge_cache_rejects_multiple_modes(self) -> None:
+        async with _patch_cf_client() as mock_request:
+            result = await purge_cache(
+                zone_id=ZONE_ID, files=["https://example.com/a.css"], tags=["static"]
+            )
+            assert "error" in result
+            mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_purge_cache_rejects_too_many_tags(self) -> None:
+        async with _patch_cf_client():
+            with pytest.raises(PydanticValidationError):
+                await purge_cache(zone_id=ZONE_ID, tags=[f"tag{i}" for i in range(31)])
+
 
 # =============================================================================
 # Mocked API Tests — Page Rules Tools
@@ -372,6 +876,120 @@ class TestPageRulesTools:
             result = await list_page_rules(zone_id=ZONE_ID)
             assert "page_rules" in result
 
+    @pytest.mark.asyncio
+    async def test_create_page_rule(self) -> None:
+        resp = _mock_cf_response(
+            json_data={"success": True, "result": {"id": "rule1", "status": "active"}}
+        )
+        async with _patch_cf_client(response=resp):
+            result = await create_page_rule(
+                zone_id=ZONE_ID,
+                targets=[{"target": "url", "constraint": {"operator": "matches", "value": "*"}}],
+                actions=[{"id": "always_use_https"}],
+            )
+            assert result["page_rule"]["id"] == "rule1"
+
+    @pytest.mark.asyncio
+    async def test_create_page_rule_rejects_invalid_status(self) -> None:
+        async with _patch_cf_client():
+            with pytest.raises(PydanticValidationError):
+                await create_page_rule(
+                    zone_id=ZONE_ID,
+                    targets=[{"target": "url"}],
+                    actions=[{"id": "always_use_https"}],
+                    status="paused",
+                )
+
+
+# =============================================================================
+# Mocked API Tests — Transform Rules Tools
+# =============================================================================
+
+RULESET_ID = "f" * 32
+HEADER_RULE = {
+    "expression": "true",
+    "description": "Add custom header",
+    "action": "rewrite",
+    "action_parameters": {"headers": {"X-Custom": {"operation": "set", "value": "1"}}},
+}
+
+
+class TestTransformTools:
+    """Tests for transform rules tools."""
+
+    @pytest.mark.asyncio
+    async def test_set_rules_puts_phase_entrypoint(self) -> None:
+        current = _mock_cf_response(
+            json_data={"success": True, "result": {"id": RULESET_ID, "rules": []}}
+        )
+        updated = _mock_cf_response(
+            json_data={"success": True, "result": {"id": RULESET_ID, "rules": [HEADER_RULE]}}
+        )
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [current, updated]
+            result = await set_request_header_rules(zone_id=ZONE_ID, rules=[HEADER_RULE])
+            assert result["ruleset_id"] == RULESET_ID
+            assert mock_request.call_count == 2
+            request = mock_request.call_args.args[0]
+            assert request.method == "PUT"
+            assert request.url.path.endswith(
+                "/rulesets/phases/http_request_late_transform/entrypoint"
+            )
+
+    @pytest.mark.asyncio
+    async def test_set_rules_unchanged_skips_put(self) -> None:
+        stored_rule = {
+            **HEADER_RULE,
+            "id": "r" * 32,
+            "version": "1",
+            "ref": "r" * 32,
+            "enabled": True,
+        }
+        resp = _mock_cf_response(
+            json_data={"success": True, "result": {"id": RULESET_ID, "rules": [stored_rule]}}
+        )
+        async with _patch_cf_client(response=resp) as mock_request:
+            result = await set_request_header_rules(zone_id=ZONE_ID, rules=[HEADER_RULE])
+            assert result["rules"] == [stored_rule]
+            assert mock_request.call_count == 1
+            assert mock_request.call_args.args[0].method == "GET"
+
+    @pytest.mark.asyncio
+    async def test_set_rules_reads_live_ruleset(self) -> None:
+        stale = _mock_cf_response(
+            json_data={"success": True, "result": {"id": RULESET_ID, "rules": []}}
+        )
+        live = _mock_cf_response(
+            json_data={"success": True, "result": {"id": RULESET_ID, "rules": [HEADER_RULE]}}
+        )
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [stale, live]
+            await list_request_header_rules(zone_id=ZONE_ID)
+            await set_request_header_rules(zone_id=ZONE_ID, rules=[HEADER_RULE])
+            assert mock_request.call_count == 2
+            assert mock_request.call_args.args[0].method == "GET"
+
+    @pytest.mark.asyncio
+    async def test_list_rules_without_entrypoint(self) -> None:
+        resp = _mock_cf_response(
+            status_code=404,
+            json_data={"success": False, "errors": [{"code": 10003, "message": "not found"}]},
+        )
+        async with _patch_cf_client(response=resp):
+            result = await list_request_header_rules(zone_id=ZONE_ID)
+            assert result["ruleset_id"] is None
+            assert result["rules"] == []
+
+    @pytest.mark.asyncio
+    async def test_list_rules_unknown_zone(self) -> None:
+        resp = _mock_cf_response(
+            status_code=404,
+            json_data={"success": False, "errors": [{"code": 7003, "message": "no route"}]},
+        )
+        async with _patch_cf_client(response=resp):
+            with pytest.raises(ZoneNotFoundError):
+                await list_request_header_rules(zone_id=ZONE_ID)
+
 
 # =============================================================================
 # Mocked API Tests — Analytics Tools
@@ -411,3 +1029,32 @@ class TestAnalyticsTools:
         async with _patch_cf_client(response=resp):
             result = await get_zone_analytics(zone_id=ZONE_ID)
             assert "requests" in result
+
+
+# =============================================================================
+# Mocked API Tests — WAF Tools
+# =============================================================================
+
+
+class TestWafTools:
+    """Tests for WAF custom rules tools."""
+
+    @pytest.mark.asyncio
+    async def test_create_rule_reads_live_ruleset(self) -> None:
+        none_yet = _mock_cf_response(json_data={"success": True, "result": []})
+        live = _mock_cf_response(
+            json_data={
+                "success": True,
+                "result": [{"id": RULESET_ID, "phase": WAF_PHASE, "kind": "zone"}],
+            }
+        )
+        created = _mock_cf_response(
+            json_data={"success": True, "result": {"id": RULESET_ID, "rules": [{"id": "r1"}]}}
+        )
+        async with _patch_cf_client() as mock_request:
+            mock_request.side_effect = [none_yet, live, created]
+            await list_waf_rules(zone_id=ZONE_ID)
+            await create_waf_rule(zone_id=ZONE_ID, expression="true", action="block")
+            assert mock_request.call_count == 3
+            request = mock_request.call_args.args[0]
+            assert request.url.path.endswith(f"/rulesets/{RULESET_ID}/rules")
@@ -1,7 +1,12 @@
 """Tests for input validation."""
 
+import re
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from mcp_cloudflare_crunchtools.models import (
     DnsRecordInput,
@@ -12,199 +17,165 @@ from mcp_cloudflare_crunchtools.models import (
     validate_zone_id,
 )
 
+# Valid baseline records; invalid cases override a single field
+BASE_A = MappingProxyType({"type": "A", "name": "www", "content": "192.168.1.1"})
+BASE_MX = MappingProxyType({"type": "MX", "name": "@", "content": "mail.example.com"})
 
-class TestZoneIdValidation:
-    """Tests for zone_id validation."""
-
-    def test_valid_zone_id(self) -> None:
-        """Valid 32-character hex string should pass."""
-        zone_id = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4"
-        assert validate_zone_id(zone_id) == zone_id
-
-    def test_invalid_zone_id_too_short(self) -> None:
-        """Zone ID that is too short should fail."""
-        with pytest.raises(ValueError, match="32-character hex"):
-            validate_zone_id("abc123")
-
-    def test_invalid_zone_id_too_long(self) -> None:
-        """Zone ID that is too long should fail."""
-        with pytest.raises(ValueError, match="32-character hex"):
-            validate_zone_id("a" * 33)
-
-    def test_invalid_zone_id_non_hex(self) -> None:
-        """Zone ID with non-hex characters should fail."""
-        with pytest.raises(ValueError, match="32-character hex"):
-            validate_zone_id("g" * 32)  # 'g' is not hex
-
-    def test_invalid_zone_id_uppercase(self) -> None:
-        """Zone ID with uppercase should fail (Cloudflare uses lowercase)."""
-        with pytest.raises(ValueError, match="32-character hex"):
-            validate_zone_id("A" * 32)
+# A well-formed Cloudflare ID (32 lowercase hex characters)
+GOOD_ID: Final = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4"
+ID_VALIDATORS = [validate_zone_id, validate_record_id, validate_rule_id]
+MATCH_HEX32 = re.compile("32-character hex")
 
 
-class TestRecordIdValidation:
-    """Tests for record_id validation."""
+def _errs(adapter: TypeAdapter[Any], payload: Mapping[str, Any]) -> list[tuple[Any, str]]:
+    """Validate a payload and return the (location, error type) of each failure."""
+    try:
+        adapter.validate_python(payload)
+    except ValidationError as e:
+        return [(error["loc"], error["type"]) for error in e.errors()]
+    return []
 
-    def test_valid_record_id(self) -> None:
-        """Valid 32-character hex string should pass."""
-        record_id = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4"
-        assert validate_record_id(record_id) == record_id
 
-    def test_invalid_record_id(self) -> None:
-        """Invalid record ID should fail."""
-        with pytest.raises(ValueError, match="32-character hex"):
-            validate_record_id("invalid")
+def _assert_invalid(adapter: TypeAdapter[Any], payload: Mapping[str, Any]) -> None:
+    """Assert that a payload fails validation."""
+    if not _errs(adapter, payload):
+        pytest.fail(f"expected a validation error for {dict(payload)!r}")
 
 
-class TestRuleIdValidation:
-    """Tests for rule_id validation."""
+@pytest.mark.parametrize("validator", ID_VALIDATORS)
+class TestHexIdValidation:
+    """Tests for zone_id, record_id, and rule_id validation."""
 
-    def test_valid_rule_id(self) -> None:
+    def test_valid_id(self, validator: Callable[[str], str]) -> None:
         """Valid 32-character hex string should pass."""
-        rule_id = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4"
-        assert validate_rule_id(rule_id) == rule_id
-
-    def test_invalid_rule_id(self) -> None:
-        """Invalid rule ID should fail."""
-        with pytest.raises(ValueError, match="32-character hex"):
-            validate_rule_id("invalid")
+        assert validator(GOOD_ID) == GOOD_ID
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("abc123", id="too-short"),
+            pytest.param("a" * 33, id="too-long"),
+            pytest.param("g" * 32, id="non-hex"),
+            pytest.param("A" * 32, id="uppercase"),  # Cloudflare uses lowercase
+            pytest.param("invalid", id="word"),
+        ],
+    )
+    def test_invalid_id(self, validator: Callable[[str], str], value: str) -> None:
+        """Malformed IDs should fail."""
+        with pytest.raises(ValueError, match=MATCH_HEX32):
+            validator(value)
 
 
 class TestZoneInput:
     """Tests for ZoneInput model."""
 
-    def test_valid_zone_id(self) -> None:
+    def test_valid_zone_id(self, zone_ta: TypeAdapter[ZoneInput]) -> None:
         """Valid zone_id should pass."""
-        zone = ZoneInput(zone_id="a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4")
-        assert zone.zone_id == "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4"
+        zone = zone_ta.validate_python({"zone_id": GOOD_ID})
+        assert zone.zone_id == GOOD_ID
 
-    def test_valid_zone_name(self) -> None:
+    def test_valid_zone_name(self, zone_ta: TypeAdapter[ZoneInput]) -> None:
         """Valid zone_name should pass."""
-        zone = ZoneInput(zone_name="example.com")
+        zone = zone_ta.validate_python({"zone_name": "example.com"})
         assert zone.zone_name == "example.com"
 
-    def test_invalid_zone_id(self) -> None:
+    def test_invalid_zone_id(self, zone_ta: TypeAdapter[ZoneInput]) -> None:
         """Invalid zone_id should fail validation."""
+        _assert_invalid(zone_ta, {"zone_id": "invalid"})
+
+    def test_immutable(self, zone_ta: TypeAdapter[ZoneInput]) -> None:
+        """Validated input cannot be modified afterwards."""
+        zone = zone_ta.validate_python({"zone_id": GOOD_ID})
         with pytest.raises(ValidationError):
-            ZoneInput(zone_id="invalid")
+            zone.zone_id = "invalid"
 
-    def test_extra_fields_rejected(self) -> None:
+    def test_extra_fields_rejected(self, zone_ta: TypeAdapter[ZoneInput]) -> None:
         """Extra fields should be rejected."""
-        with pytest.raises(ValidationError):
-            ZoneInput(zone_id="a" * 32, extra_field="value")  # type: ignore[call-arg]
+        _assert_invalid(zone_ta, {"zone_id": GOOD_ID, "extra_field": "value"})
 
 
 class TestDnsRecordInput:
     """Tests for DnsRecordInput model."""
 
-    def test_valid_a_record(self) -> None:
-        """Valid A record should pass."""
-        record = DnsRecordInput(
-            type="A",
-            name="www",
-            content="192.168.1.1",
-        )
-        assert record.type == "A"
-        assert record.name == "www"
-        assert record.content == "192.168.1.1"
-        assert record.ttl == 1
-        assert record.proxied is False
-
-    def test_valid_mx_record_with_priority(self) -> None:
-        """Valid MX record with priority should pass."""
-        record = DnsRecordInput(
-            type="MX",
-            name="@",
-            content="mail.example.com",
-            priority=10,
-        )
-        assert record.priority == 10
-
-    def test_case_insensitive_type(self) -> None:
-        """Record type should be normalized to uppercase."""
-        record = DnsRecordInput(
-            type="aaaa",
-            name="www",
-            content="2001:db8::1",
-        )
-        assert record.type == "AAAA"
-
-    def test_invalid_record_type(self) -> None:
+    def test_valid_records_batch(
+        self, dns_list_ta: TypeAdapter[list[DnsRecordInput]]
+    ) -> None:
+        """Valid records should pass, with defaults applied and type normalized."""
+        a_record, mx_record, aaaa_record = dns_list_ta.validate_python([
+            {"type": "A", "name": "www", "content": "192.168.1.1"},
+            {"type": "MX", "name": "@", "content": "mail.example.com", "priority": 10},
+            {"type": "aaaa", "name": "www", "content": "2001:db8::1"},
+        ])
+
+        assert a_record.type == "A"
+        assert a_record.name == "www"
+        assert a_record.content == "192.168.1.1"
+        assert a_record.ttl == 1
+        assert a_record.proxied is False
+
+        assert mx_record.priority == 10
+
+        # Record type is normalized to uppercase
+        assert aaaa_record.type == "AAAA"
+
+    def test_invalid_record_type(self, dns_ta: TypeAdapter[DnsRecordInput]) -> None:
         """Invalid record type should fail."""
-        with pytest.raises(ValidationError):
-            DnsRecordInput(
-                type="INVALID",
-                name="www",
-                content="test",
-            )
+        assert _errs(dns_ta, {**BASE_A, "type": "INVALID"}) == [(("type",), "value_error")]
 
-    def test_name_too_long(self) -> None:
+    def test_name_too_long(self, dns_ta: TypeAdapter[DnsRecordInput]) -> None:
         """Name exceeding max length should fail."""
-        with pytest.raises(ValidationError):
-            DnsRecordInput(
-                type="A",
-                name="a" * 256,
-                content="192.168.1.1",
-            )
+        assert _errs(dns_ta, {**BASE_A, "name": "a" * 256}) == [(("name",), "string_too_long")]
 
-    def test_content_too_long(self) -> None:
+    def test_content_too_long(self, dns_ta: TypeAdapter[DnsRecordInput]) -> None:
         """Content exceeding max length should fail."""
-        with pytest.raises(ValidationError):
-            DnsRecordInput(
-                type="TXT",
-                name="www",
-                content="a" * 2049,
-            )
-
-    def test_ttl_range(self) -> None:
+        payload = {**BASE_A, "type": "TXT", "content": "a" * 2049}
+        assert _errs(dns_ta, payload) == [(("content",), "string_too_long")]
+
+    @pytest.mark.parametrize(
+        ("ttl", "error_type"),
+        [(0, "greater_than_equal"), (86401, "less_than_equal")],
+    )
+    def test_ttl_range(
+        self, dns_ta: TypeAdapter[DnsRecordInput], ttl: int, error_type: str
+    ) -> None:
         """TTL outside valid range should fail."""
-        with pytest.raises(ValidationError):
-            DnsRecordInput(
-                type="A",
-                name="www",
-                content="192.168.1.1",
-                ttl=0,
-            )
-
-        with pytest.raises(ValidationError):
-            DnsRecordInput(
-                type="A",
-                name="www",
-                content="192.168.1.1",
-                ttl=86401,
-            )
-
-    def test_priority_range(self) -> None:
+        assert _errs(dns_ta, {**BASE_A, "ttl": ttl}) == [(("ttl",), error_type)]
+
+    @pytest.mark.parametrize(
+        ("priority", "error_type"),
+        [(-1, "greater_than_equal"), (65536, "less_than_equal")],
+    )
+    def test_priority_range(
+        self, dns_ta: TypeAdapter[DnsRecordInput], priority: int, error_type: str
+    ) -> None:
         """Priority outside valid range should fail."""
-        with pytest.raises(ValidationError):
-            DnsRecordInput(
-                type="MX",
-                name="@",
-                content="mail.example.com",
-                priority=-1,
-            )
-
-        with pytest.raises(ValidationError):
-            DnsRecordInput(
-                type="MX",
-                name="@",
-                content="mail.example.com",
-                priority=65536,
-            )
+        assert _errs(dns_ta, {**BASE_MX, "priority": priority}) == [(("priority",), error_type)]
 
 
 class TestDnsRecordUpdateInput:
     """Tests for DnsRecordUpdateInput model."""
 
-    def test_partial_update(self) -> None:
+    def test_partial_update(self, dns_update_ta: TypeAdapter[DnsRecordUpdateInput]) -> None:
         """Partial update with only some fields should pass."""
-        update = DnsRecordUpdateInput(content="192.168.1.2")
+        update = dns_update_ta.validate_python({"content": "192.168.1.2"})
         assert update.content == "192.168.1.2"
         assert update.type is None
         assert update.name is None
 
-    def test_all_fields_none(self) -> None:
+    def test_type_normalized(self, dns_update_ta: TypeAdapter[DnsRecordUpdateInput]) -> None:
+        """Record type on update should be validated like on create."""
+        assert dns_update_ta.validate_python({"type": "cname"}).type == "CNAME"
+        _assert_invalid(dns_update_ta, {"type": "INVALID"})
+
+    def test_field_bounds_match_create(
+        self, dns_update_ta: TypeAdapter[DnsRecordUpdateInput]
+    ) -> None:
+        """Update fields should enforce the same bounds as creation."""
+        for update in ({"ttl": 0}, {"priority": 65536}, {"name": ""}, {"content": "a" * 2049}):
+            _assert_invalid(dns_update_ta, update)
+
+    def test_all_fields_none(self, dns_update_ta: TypeAdapter[DnsRecordUpdateInput]) -> None:
         """All fields None should be valid (checked at tool level)."""
-        update = DnsRecordUpdateInput()
+        update = dns_update_ta.validate_python({})
         assert update.type is None
         assert update.content is None